@@ -3,13 +3,22 @@
 Usage:
     ogun validate <scenario.json>     Validate scenario file
     ogun run <scenario.json>          Run simulation
+    ogun run <scenario.json> --runs N Run N seeded replications in parallel
     ogun schema                       Output JSON schema
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from pj_ogun.models.scenario import Scenario
+
+# KPI dicts are keyed by Priority int in by_priority
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 
 def cmd_validate(args: argparse.Namespace) -> int:
@@ -31,11 +40,11 @@ def cmd_validate(args: argparse.Namespace) -> int:
         print(scenario.summary())
         return 0
     
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON at line {e.lineno}: {e.msg}", file=sys.stderr)
-        return 1
-    
     except ValidationError as e:
+        json_errors = [err for err in e.errors() if err["type"] == "json_invalid"]
+        if json_errors:
+            print(f"ERROR: {json_errors[0]['msg']}", file=sys.stderr)
+            return 1
         print(f"ERROR: Schema validation failed:", file=sys.stderr)
         for error in e.errors():
             loc = " -> ".join(str(x) for x in error["loc"])
@@ -63,6 +72,9 @@ def cmd_run(args: argparse.Namespace) -> int:
         print(f"Seed: {scenario.config.random_seed}")
         print()
 
+        if args.runs > 1:
+            return _run_replications(scenario, args)
+
         # Run simulation
         print("Running simulation...")
         engine = SimulationEngine(scenario)
@@ -93,8 +105,7 @@ def cmd_run(args: argparse.Namespace) -> int:
             # Save KPIs JSON
             kpis_path = output_dir / "kpis.json"
             all_kpis = compute_all_kpis(event_log)
-            with open(kpis_path, "w") as f:
-                json.dump(all_kpis, f, indent=2)
+            kpis_path.write_bytes(orjson.dumps(all_kpis, option=_JSON_OPTIONS))
             print(f"KPIs saved to: {kpis_path}")
 
         return 0
@@ -104,24 +115,103 @@ def cmd_run(args: argparse.Namespace) -> int:
         return 1
 
 
+def _run_replication(payload: bytes, seed: int) -> dict[str, Any]:
+    """Run one seeded replication in a worker process and return its KPIs.
+
+    The scenario travels as JSON bytes rather than a pickled model.
+    """
+    from pj_ogun.analysis.kpis import compute_all_kpis
+    from pj_ogun.models.scenario import Scenario
+    from pj_ogun.simulation.engine import SimulationEngine
+
+    scenario = Scenario.model_validate_json(payload)
+    scenario.config.random_seed = seed
+    event_log = SimulationEngine(scenario).run()
+    return compute_all_kpis(event_log)
+
+
+def _run_replications(scenario: "Scenario", args: argparse.Namespace) -> int:
+    """Run independent replications of a scenario across worker processes.
+
+    Replication i uses seed ``random_seed + i``, so a sweep is reproducible
+    and its first run matches a single ``ogun run`` of the same scenario.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    import pandas as pd
+
+    base_seed = scenario.config.random_seed
+    seeds = [base_seed + i for i in range(args.runs)]
+    payload = scenario.model_dump_json(by_alias=True).encode()
+
+    print(f"Running {args.runs} replications...")
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(_run_replication, repeat(payload), seeds))
+
+    rows = []
+    for i, (seed, kpis) in enumerate(zip(seeds, results)):
+        medevac = {k: v for k, v in kpis["medevac"].items() if k != "by_priority"}
+        rows.append({"run": i, "seed": seed, **medevac})
+    runs_df = pd.DataFrame(rows)
+
+    metrics = [
+        "total_casualties",
+        "casualties_treated",
+        "mean_wait_time_mins",
+        "mean_evacuation_time_mins",
+        "p90_evacuation_time_mins",
+    ]
+    print()
+    print("MEDEVAC KPIs across replications:")
+    print(runs_df[metrics].agg(["mean", "min", "max"]).T.to_string(float_format="{:.1f}".format))
+
+    if args.output:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        runs_path = output_dir / "runs.csv"
+        runs_df.to_csv(runs_path, index=False)
+        print(f"\nPer-run KPIs saved to: {runs_path}")
+
+        kpis_path = output_dir / "kpis_runs.json"
+        kpis_path.write_bytes(orjson.dumps(
+            [{"seed": seed, **kpis} for seed, kpis in zip(seeds, results)],
+            option=_JSON_OPTIONS,
+        ))
+        print(f"Full KPIs saved to: {kpis_path}")
+
+    return 0
+
+
 def cmd_schema(args: argparse.Namespace) -> int:
     """Output JSON schema for scenario files."""
     from pj_ogun.models.scenario import Scenario
     
-    schema = Scenario.model_json_schema()
+    schema_json = orjson.dumps(Scenario.cached_schema(), option=orjson.OPT_INDENT_2)
     
     if args.output:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(schema, f, indent=2)
+        output_path.write_bytes(schema_json)
         print(f"Schema written to: {output_path}")
     else:
-        print(json.dumps(schema, indent=2))
+        print(schema_json.decode())
     
     return 0
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -148,6 +238,18 @@ def main() -> int:
         "--output", "-o",
         help="Output directory for results",
     )
+    p_run.add_argument(
+        "--runs", "-n",
+        type=_positive_int,
+        default=1,
+        help="Number of replications, seeded random_seed + i (default: 1)",
+    )
+    p_run.add_argument(
+        "--workers", "-w",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for replications (default: CPU count)",
+    )
     p_run.set_defaults(func=cmd_run)
     
     # schema command
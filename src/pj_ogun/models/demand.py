@@ -10,12 +10,16 @@ Demand can be specified manually (explicit event list) or
 generated stochastically from rates (Poisson process).
 """
 
-from typing import Optional
+import math
+from typing import TYPE_CHECKING, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
 from pj_ogun.models.enums import DemandMode, DemandType, Priority
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class ManualDemandEvent(BaseModel):
     """A specific demand event at a known time.
@@ -51,7 +55,12 @@ class ManualDemandEvent(BaseModel):
         description="Additional event-specific properties"
     )
     
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
+
+
+# Default priority mix for rate-based demand (already known to be valid)
+_DEFAULT_PRIORITY_WEIGHTS: dict[int, float] = {1: 0.1, 2: 0.3, 3: 0.6}
+_VALID_PRIORITIES = frozenset({1, 2, 3, 4})
 
 
 class RateBasedDemand(BaseModel):
@@ -75,7 +84,7 @@ class RateBasedDemand(BaseModel):
         description="Mean arrival rate (events per hour)"
     )
     priority_weights: dict[int, float] = Field(
-        default={1: 0.1, 2: 0.3, 3: 0.6},
+        default=_DEFAULT_PRIORITY_WEIGHTS,
         description="Probability weights for priority levels {1: P(urgent), 2: P(priority), 3: P(routine)}"
     )
     
@@ -127,22 +136,76 @@ class RateBasedDemand(BaseModel):
     @model_validator(mode="after")
     def validate_priority_weights(self) -> "RateBasedDemand":
         """Ensure priority weights sum to ~1 and use valid priorities."""
+        if self.priority_weights == _DEFAULT_PRIORITY_WEIGHTS:
+            return self
         if not self.priority_weights:
             raise ValueError("priority_weights cannot be empty")
         
-        valid_priorities = {1, 2, 3, 4}
         for p in self.priority_weights:
-            if p not in valid_priorities:
-                raise ValueError(f"Invalid priority {p}. Must be in {valid_priorities}")
+            if p not in _VALID_PRIORITIES:
+                raise ValueError(f"Invalid priority {p}. Must be in {set(_VALID_PRIORITIES)}")
         
-        total = sum(self.priority_weights.values())
+        total = math.fsum(self.priority_weights.values())
         if not (0.99 <= total <= 1.01):
             raise ValueError(
                 f"priority_weights must sum to 1.0, got {total:.3f}"
             )
         return self
     
-    model_config = {"extra": "forbid"}
+    def sample_arrival_times(
+        self,
+        rng: "np.random.Generator",
+        duration_mins: float,
+    ) -> "np.ndarray":
+        """Sample Poisson arrival times within the active window.
+        
+        Exponential inter-arrival gaps are drawn in batches and
+        accumulated, rather than one draw per event.
+        
+        Args:
+            rng: NumPy random generator (seeded by the caller)
+            duration_mins: Simulation length, used when active_until_mins is None
+            
+        Returns:
+            Sorted arrival times in minutes from simulation start
+        """
+        import numpy as np
+        
+        start = self.active_from_mins
+        end = self.active_until_mins if self.active_until_mins is not None else duration_mins
+        if end <= start:
+            return np.empty(0, dtype=np.float64)
+        
+        mean_interval = 60.0 / self.rate_per_hour  # minutes
+        batch_size = int((end - start) / mean_interval * 1.5) + 10
+        
+        batches = []
+        t = start
+        while t < end:
+            arrivals = t + np.cumsum(rng.exponential(mean_interval, size=batch_size))
+            batches.append(arrivals)
+            t = arrivals[-1]
+        
+        times = np.concatenate(batches)
+        return times[times < end]
+    
+    model_config = {"extra": "forbid", "frozen": True}
+
+
+# Field each demand mode reads, and the error raised if it is empty.
+# A field of None marks a mode that is not yet supported.
+_MODE_REQUIREMENTS: dict[DemandMode, tuple[Optional[str], str]] = {
+    DemandMode.MANUAL: (
+        "manual_events",
+        "Manual demand mode requires at least one event in manual_events",
+    ),
+    DemandMode.RATE_BASED: (
+        "rate_based",
+        "Rate-based demand mode requires at least one config in rate_based",
+    ),
+    # Future: validate phase configuration
+    DemandMode.PHASE_DRIVEN: (None, "Phase-driven demand mode not yet implemented"),
+}
 
 
 class DemandConfiguration(BaseModel):
@@ -177,22 +240,26 @@ class DemandConfiguration(BaseModel):
     @model_validator(mode="after")
     def validate_mode_has_data(self) -> "DemandConfiguration":
         """Ensure selected mode has corresponding data."""
-        if self.mode == DemandMode.MANUAL:
-            if not self.manual_events:
-                raise ValueError(
-                    "Manual demand mode requires at least one event in manual_events"
-                )
-        elif self.mode == DemandMode.RATE_BASED:
-            if not self.rate_based:
-                raise ValueError(
-                    "Rate-based demand mode requires at least one config in rate_based"
-                )
-        elif self.mode == DemandMode.PHASE_DRIVEN:
-            # Future: validate phase configuration
-            raise ValueError("Phase-driven demand mode not yet implemented")
-        
+        field, message = _MODE_REQUIREMENTS[self.mode]
+        if field is None or not getattr(self, field):
+            raise ValueError(message)
+        return self
+    
+    @model_validator(mode="after")
+    def sort_manual_events(self) -> "DemandConfiguration":
+        """Keep manual events in time order (stable for equal times)."""
+        self.manual_events.sort(key=lambda e: e.time_mins)
         return self
     
+    def get_manual_events_sorted(self) -> list[ManualDemandEvent]:
+        """Get manual events sorted by time.
+        
+        Events are sorted once at validation, so this returns the stored
+        list without re-sorting. Events appended afterwards are not
+        re-ordered.
+        """
+        return self.manual_events
+    
     def get_all_locations(self) -> set[str]:
         """Get all node IDs referenced by demand configuration."""
         locations = set()
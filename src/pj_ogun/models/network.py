@@ -21,6 +21,8 @@ class Coordinates(BaseModel):
     # latitude: Optional[float] = Field(None, ge=-90, le=90)
     # longitude: Optional[float] = Field(None, ge=-180, le=180)
     
+    model_config = {"frozen": True}
+    
     def distance_to(self, other: "Coordinates") -> float:
         """Euclidean distance to another coordinate point."""
         return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
@@ -61,6 +63,8 @@ class NodeCapacity(BaseModel):
         None, ge=0,
         description="Concurrent loading/unloading operations"
     )
+    
+    model_config = {"frozen": True}
 
 
 class NodeProperties(BaseModel):
@@ -131,6 +135,8 @@ class NodeProperties(BaseModel):
         None, ge=0, le=23,
         description="End of operating hours (24h clock)"
     )
+    
+    model_config = {"frozen": True}
 
 
 class Node(BaseModel):
@@ -175,7 +181,12 @@ class Node(BaseModel):
         """Normalise node ID: strip whitespace, replace spaces with underscores."""
         return v.strip().replace(" ", "_")
     
-    model_config = {"extra": "forbid"}
+    # Immutable once loaded, so nodes can be shared between simulation runs
+    model_config = {"extra": "forbid", "frozen": True}
+    
+    def __hash__(self) -> int:
+        # Equal nodes always share an ID; hashing it skips the nested properties
+        return hash((type(self).__name__, self.id))
 
 
 class EdgeProperties(BaseModel):
@@ -199,6 +210,8 @@ class EdgeProperties(BaseModel):
         None,
         description="Optional name for the route (e.g., 'MSR BRONZE')"
     )
+    
+    model_config = {"frozen": True}
 
 
 class Edge(BaseModel):
@@ -235,8 +248,13 @@ class Edge(BaseModel):
     model_config = {
         "extra": "forbid",
         "populate_by_name": True,  # Allow both 'from' and 'from_node'
+        "frozen": True,
     }
     
+    def __hash__(self) -> int:
+        # Edges have no ID; equal edges share endpoints, so hash those
+        return hash((type(self).__name__, self.from_node, self.to_node))
+    
     def travel_time_mins(
         self, 
         speed_kmh: float, 
@@ -5,7 +5,8 @@ It includes the network topology, vehicle fleet, demand configuration,
 and simulation parameters.
 """
 
-from typing import Optional
+from functools import cache
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -217,6 +218,15 @@ class Scenario(BaseModel):
         }
         return [v for v in self.vehicles if v.type_id in type_ids_for_role]
     
+    @classmethod
+    @cache
+    def cached_schema(cls) -> dict[str, Any]:
+        """JSON schema for scenario files, built once per class.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        return cls.model_json_schema()
+    
     def summary(self) -> str:
         """Generate human-readable scenario summary."""
         lines = [
@@ -250,19 +260,17 @@ def load_scenario(path: str) -> Scenario:
         
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValidationError: If JSON doesn't match schema
+        ValidationError: If file is not valid JSON (error type
+            ``json_invalid``) or doesn't match schema
     """
-    import json
     from pathlib import Path
     
     file_path = Path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"Scenario file not found: {path}")
     
-    with open(file_path) as f:
-        data = json.load(f)
-    
-    return Scenario.model_validate(data)
+    # Parse and validate in one pass without building a Python dict first
+    return Scenario.model_validate_json(file_path.read_bytes())
 
 
 def save_scenario(scenario: Scenario, path: str, indent: int = 2) -> None:
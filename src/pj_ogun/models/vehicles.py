@@ -1,6 +1,6 @@
 """Vehicle type definitions and fleet management models."""
 
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -40,6 +40,8 @@ class SpeedProfile(BaseModel):
     def get_speed(self, is_laden: bool) -> float:
         """Return appropriate speed based on load state."""
         return self.laden_kmh if is_laden else self.unladen_kmh
+    
+    model_config = {"frozen": True}
 
 
 class ServiceTimes(BaseModel):
@@ -69,6 +71,8 @@ class ServiceTimes(BaseModel):
     def recovery_needs_hookup(self) -> "ServiceTimes":
         """Note: hookup_time validation happens at VehicleType level."""
         return self
+    
+    model_config = {"frozen": True}
 
 
 class VehicleType(BaseModel):
@@ -157,32 +161,54 @@ class VehicleType(BaseModel):
     @model_validator(mode="after")
     def validate_role_requirements(self) -> "VehicleType":
         """Ensure role-specific requirements are met."""
-        
-        # Ambulances must have casualty capacity
-        if self.role == VehicleRole.AMBULANCE:
-            if not self.casualty_capacity or self.casualty_capacity < 1:
-                raise ValueError("Ambulance must have casualty_capacity >= 1")
-        
-        # Recovery vehicles must have tow capacity and hookup time
-        if self.role == VehicleRole.RECOVERY:
-            if not self.tow_capacity_class:
-                raise ValueError("Recovery vehicle must specify tow_capacity_class")
-            if self.service_times.hookup_time_mins is None:
-                raise ValueError("Recovery vehicle must specify hookup_time_mins")
-        
-        # Ammo logistics must have ammo capacity
-        if self.role == VehicleRole.AMMO_LOGISTICS:
-            if not self.ammo_capacity_units or self.ammo_capacity_units < 1:
-                raise ValueError("Ammo logistics vehicle must have ammo_capacity_units >= 1")
-        
-        # Fuel logistics must have fuel capacity
-        if self.role == VehicleRole.FUEL_LOGISTICS:
-            if not self.fuel_capacity_litres or self.fuel_capacity_litres < 1:
-                raise ValueError("Fuel logistics vehicle must have fuel_capacity_litres >= 1")
-        
+        check = _ROLE_VALIDATORS.get(self.role)
+        if check is not None:
+            check(self)
         return self
     
-    model_config = {"extra": "forbid"}
+    # Immutable once loaded, so types can be shared between simulation runs
+    model_config = {"extra": "forbid", "frozen": True}
+    
+    def __hash__(self) -> int:
+        # Library templates are keyed by type ID; hash on that alone
+        return hash((type(self).__name__, self.id))
+
+
+# === Role Requirements ===
+# Each check raises ValueError if the vehicle type lacks what its role needs
+
+def _validate_ambulance(vt: VehicleType) -> None:
+    """Ambulances must have casualty capacity."""
+    if vt.casualty_capacity is None or vt.casualty_capacity < 1:
+        raise ValueError("Ambulance must have casualty_capacity >= 1")
+
+
+def _validate_recovery(vt: VehicleType) -> None:
+    """Recovery vehicles must have tow capacity and hookup time."""
+    if vt.tow_capacity_class is None:
+        raise ValueError("Recovery vehicle must specify tow_capacity_class")
+    if vt.service_times.hookup_time_mins is None:
+        raise ValueError("Recovery vehicle must specify hookup_time_mins")
+
+
+def _validate_ammo_logistics(vt: VehicleType) -> None:
+    """Ammo logistics must have ammo capacity."""
+    if vt.ammo_capacity_units is None or vt.ammo_capacity_units < 1:
+        raise ValueError("Ammo logistics vehicle must have ammo_capacity_units >= 1")
+
+
+def _validate_fuel_logistics(vt: VehicleType) -> None:
+    """Fuel logistics must have fuel capacity."""
+    if vt.fuel_capacity_litres is None or vt.fuel_capacity_litres < 1:
+        raise ValueError("Fuel logistics vehicle must have fuel_capacity_litres >= 1")
+
+
+_ROLE_VALIDATORS: dict[VehicleRole, Callable[[VehicleType], None]] = {
+    VehicleRole.AMBULANCE: _validate_ambulance,
+    VehicleRole.RECOVERY: _validate_recovery,
+    VehicleRole.AMMO_LOGISTICS: _validate_ammo_logistics,
+    VehicleRole.FUEL_LOGISTICS: _validate_fuel_logistics,
+}
 
 
 class Vehicle(BaseModel):
@@ -223,13 +249,18 @@ class Vehicle(BaseModel):
         description="Starting load as fraction of capacity (0=empty, 1=full)"
     )
     
-    model_config = {"extra": "forbid"}
+    # Immutable once loaded; runtime state lives in the simulation engine
+    model_config = {"extra": "forbid", "frozen": True}
+    
+    def __hash__(self) -> int:
+        # A fleet vehicle is named by its ID in events and KPIs; hash on that alone
+        return hash((type(self).__name__, self.id))
 
 
 # === Pre-built Vehicle Type Library ===
 # These can be used as templates or starting points
 
-VEHICLE_TYPE_LIBRARY: dict[str, dict] = {
+_RAW_LIBRARY: dict[str, dict] = {
     # === AMBULANCES ===
     "amb_light": {
         "id": "amb_light",
@@ -335,9 +366,20 @@ VEHICLE_TYPE_LIBRARY: dict[str, dict] = {
 }
 
 
+# Validated once at import so lookups are plain dict gets
+VEHICLE_TYPE_LIBRARY: dict[str, VehicleType] = {
+    type_id: VehicleType.model_validate(data)
+    for type_id, data in _RAW_LIBRARY.items()
+}
+
+
 def get_vehicle_type_template(type_id: str) -> VehicleType:
     """Get a pre-built vehicle type from the library.
     
+    Templates are validated when the module is imported and the same
+    instance is returned on every call. Use ``model_copy(update=...)``
+    to derive a variant rather than modifying the returned template.
+    
     Args:
         type_id: One of the keys in VEHICLE_TYPE_LIBRARY
         
@@ -346,11 +388,11 @@ def get_vehicle_type_template(type_id: str) -> VehicleType:
         
     Raises:
         KeyError: If type_id not in library
-        ValidationError: If template data is invalid (shouldn't happen)
     """
-    if type_id not in VEHICLE_TYPE_LIBRARY:
+    try:
+        return VEHICLE_TYPE_LIBRARY[type_id]
+    except KeyError:
         raise KeyError(
             f"Unknown vehicle type '{type_id}'. "
             f"Available: {list(VEHICLE_TYPE_LIBRARY.keys())}"
-        )
-    return VehicleType.model_validate(VEHICLE_TYPE_LIBRARY[type_id])
+        ) from None
@@ -1,7 +1,10 @@
 """SimPy-based discrete-event simulation engine for Pj-OGUN."""
 
-from pj_ogun.simulation.events import SimEvent, EventLog, Casualty
-from pj_ogun.simulation.engine import SimulationEngine
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pj_ogun.simulation.events import SimEvent, EventLog, Casualty
+    from pj_ogun.simulation.engine import SimulationEngine
 
 __all__ = [
     "SimulationEngine",
@@ -9,3 +12,27 @@ __all__ = [
     "EventLog",
     "Casualty",
 ]
+
+# Re-exports are resolved on first access (PEP 562), so importing
+# pj_ogun.simulation.events does not also load the engine and SimPy
+_LAZY_EXPORTS = {
+    "SimulationEngine": "pj_ogun.simulation.engine",
+    "SimEvent": "pj_ogun.simulation.events",
+    "EventLog": "pj_ogun.simulation.events",
+    "Casualty": "pj_ogun.simulation.events",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
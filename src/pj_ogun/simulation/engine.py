@@ -1,18 +1,19 @@
 """SimPy-based discrete-event simulation engine.
 
 This module contains the main SimulationEngine class that:
-1. Builds the network graph from scenario nodes/edges
+1. Builds routing tables from scenario nodes/edges
 2. Initialises SimPy environment and resources
 3. Spawns vehicle processes and demand generators
 4. Runs the simulation and collects events
 """
 
 import heapq
+import itertools
 import random
 from dataclasses import dataclass, field
-from typing import Any, Generator, Optional
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
-import networkx as nx
+import numpy as np
 import simpy
 
 from pj_ogun.models import (
@@ -30,10 +31,17 @@ from pj_ogun.models import (
 from pj_ogun.models.enums import EventType
 from pj_ogun.simulation.events import AmmoRequest, Breakdown, Casualty, EventLog
 
+if TYPE_CHECKING:
+    import networkx as nx
 
-@dataclass
+
+@dataclass(slots=True)
 class VehicleRuntime:
-    """Runtime state for a vehicle during simulation."""
+    """Runtime state for a vehicle during simulation.
+
+    Kept as one slotted record per vehicle: processes update a vehicle's
+    fields together and never scan the fleet column-wise.
+    """
 
     vehicle: Vehicle
     vehicle_type: VehicleType
@@ -63,32 +71,35 @@ class VehicleRuntime:
         self.state = self.vehicle.initial_state
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class CasualtyRequest:
-    """A request for casualty evacuation, ordered by priority."""
+    """A request for casualty evacuation, ordered by priority then arrival."""
 
     priority: int
+    seq: int
     time_requested: float = field(compare=False)
     casualty: Casualty = field(compare=False)
     location: str = field(compare=False)
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class RecoveryRequest:
-    """A request for vehicle recovery, ordered by priority."""
+    """A request for vehicle recovery, ordered by priority then arrival."""
 
     priority: int
+    seq: int
     time_requested: float = field(compare=False)
     breakdown: Breakdown = field(compare=False)
     location: str = field(compare=False)
     vehicle_class: str = field(compare=False)
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class AmmoDeliveryRequest:
-    """A request for ammunition delivery, ordered by priority."""
+    """A request for ammunition delivery, ordered by priority then arrival."""
 
     priority: int
+    seq: int
     time_requested: float = field(compare=False)
     ammo_request: AmmoRequest = field(compare=False)
     location: str = field(compare=False)
@@ -111,8 +122,20 @@ class SimulationEngine:
         # SimPy environment
         self.env: simpy.Environment = None
         
-        # Network graph
-        self.graph: nx.Graph = None
+        # Network graph (NetworkX view built on first access to .graph)
+        self._graph: Optional["nx.Graph"] = None
+        self._nodes_by_id: dict[str, Node] = {}
+
+        # All-pairs shortest effective distances (km), indexed by node_idx
+        self.node_idx: dict[str, int] = {}
+        self._node_ids: list[str] = []
+        self._shortest_km: np.ndarray = None
+        self._medical_mask: np.ndarray = None
+        self._workshop_mask: np.ndarray = None
+        self._ammo_point_mask: np.ndarray = None
+
+        # Travel time matrices (minutes) keyed by fleet speed (km/h)
+        self._travel_mins: dict[float, np.ndarray] = {}
         
         # Resources (SimPy)
         self.node_resources: dict[str, simpy.Resource] = {}
@@ -124,18 +147,22 @@ class SimulationEngine:
         self.casualty_queue: list[CasualtyRequest] = []
         self.recovery_queue: list[RecoveryRequest] = []
         self.ammo_queue: list[AmmoDeliveryRequest] = []
-
-        # Vehicle availability tracking by role
-        self.idle_ambulances: list[str] = []
-        self.idle_recovery: dict[str, list[str]] = {  # by vehicle class capability
-            "light": [],
-            "medium": [],
-            "heavy": [],
+        # Insertion counter so equal priorities are served first-come first-served
+        self._request_seq = itertools.count()
+
+        # Vehicle availability tracking by role (sets: every vehicle
+        # process checks its own membership on each poll)
+        self.idle_ambulances: set[str] = set()
+        self.idle_recovery: dict[str, set[str]] = {  # by vehicle class capability
+            "light": set(),
+            "medium": set(),
+            "heavy": set(),
         }
-        self.idle_logistics: list[str] = []
+        self.idle_logistics: set[str] = set()
 
         # Random state
         self._rng: random.Random = None
+        self._np_rng: np.random.Generator = None
     
     def run(self) -> EventLog:
         """Execute the simulation and return event log."""
@@ -170,11 +197,12 @@ class SimulationEngine:
         """Initialise all simulation components."""
         # Seed RNG
         self._rng = random.Random(self.scenario.config.random_seed)
+        self._np_rng = np.random.default_rng(self.scenario.config.random_seed)
 
         # Create SimPy environment
         self.env = simpy.Environment()
 
-        # Build network graph
+        # Build routing tables from the network
         self._build_graph()
 
         # Create node resources
@@ -183,6 +211,9 @@ class SimulationEngine:
         # Initialise vehicles
         self._init_vehicles()
 
+        # Precompute travel times for the fleet's speeds
+        self._build_travel_time_tables()
+
         # Start demand generators
         self._start_demand_generators()
 
@@ -192,34 +223,76 @@ class SimulationEngine:
         # Start extended operations processes (Phase 4)
         self._start_extended_operations()
     
+    @property
+    def graph(self) -> "nx.Graph":
+        """NetworkX view of the scenario network.
+
+        Routing uses the precomputed distance matrix, so the graph is
+        only built when something asks for it.
+        """
+        if self._graph is None:
+            import networkx as nx
+
+            graph = nx.Graph()
+            for node in self.scenario.nodes:
+                graph.add_node(
+                    node.id,
+                    node=node,
+                    x=node.coordinates.x,
+                    y=node.coordinates.y,
+                )
+            for edge in self.scenario.edges:
+                graph.add_edge(
+                    edge.from_node,
+                    edge.to_node,
+                    distance_km=edge.distance_km,
+                    effective_km=edge.distance_km * edge.properties.terrain_factor,
+                    edge=edge,
+                )
+            self._graph = graph
+        return self._graph
+
     def _build_graph(self) -> None:
-        """Build NetworkX graph from scenario edges."""
-        self.graph = nx.Graph()
-        
-        # Add nodes with attributes
-        for node in self.scenario.nodes:
-            self.graph.add_node(
-                node.id,
-                node=node,
-                x=node.coordinates.x,
-                y=node.coordinates.y,
-            )
-        
-        # Add edges with distance as weight
+        """Precompute all-pairs shortest effective distances.
+
+        Runs Floyd-Warshall over the scenario edges once so that routing
+        queries during the run are constant-time array lookups. Node
+        indices follow scenario order, so nearest-facility ties resolve
+        to the same node as a linear scan would.
+        """
+        nodes = self.scenario.nodes
+        self._graph = None
+        self._nodes_by_id = {node.id: node for node in nodes}
+        self._node_ids = [node.id for node in nodes]
+        self.node_idx = {node_id: i for i, node_id in enumerate(self._node_ids)}
+
+        n = len(nodes)
+        dist = np.full((n, n), np.inf, dtype=np.float64)
+
+        # Effective distance includes terrain factor. For MVP all edges
+        # are treated as bidirectional; a repeated edge overrides earlier ones.
         for edge in self.scenario.edges:
-            # Effective distance includes terrain factor
-            effective_dist = edge.distance_km * edge.properties.terrain_factor
-            
-            self.graph.add_edge(
-                edge.from_node,
-                edge.to_node,
-                distance_km=edge.distance_km,
-                effective_km=effective_dist,
-                edge=edge,
-            )
-            
-            # If not bidirectional, mark for directed routing
-            # (For MVP, we treat all as bidirectional)
+            i, j = self.node_idx[edge.from_node], self.node_idx[edge.to_node]
+            dist[i, j] = dist[j, i] = edge.distance_km * edge.properties.terrain_factor
+
+        np.fill_diagonal(dist, 0.0)
+
+        for k in range(n):
+            np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+
+        self._shortest_km = dist
+
+        types = [node.type for node in nodes]
+        self._medical_mask = np.array(
+            [t in (NodeType.MEDICAL_ROLE1, NodeType.MEDICAL_ROLE2) for t in types],
+            dtype=bool,
+        )
+        self._workshop_mask = np.array(
+            [t == NodeType.REPAIR_WORKSHOP for t in types], dtype=bool
+        )
+        self._ammo_point_mask = np.array(
+            [t == NodeType.AMMO_POINT for t in types], dtype=bool
+        )
     
     def _create_resources(self) -> None:
         """Create SimPy resources for nodes with capacity limits."""
@@ -250,21 +323,38 @@ class SimulationEngine:
             # Track idle vehicles by role
             if runtime.state == VehicleState.IDLE:
                 if vtype.role == VehicleRole.AMBULANCE:
-                    self.idle_ambulances.append(vehicle.id)
+                    self.idle_ambulances.add(vehicle.id)
                 elif vtype.role == VehicleRole.RECOVERY:
                     # Add to appropriate class list based on tow capability
                     tow_class = vtype.tow_capacity_class.value if vtype.tow_capacity_class else "light"
-                    self.idle_recovery[tow_class].append(vehicle.id)
+                    self.idle_recovery[tow_class].add(vehicle.id)
                 elif vtype.role == VehicleRole.AMMO_LOGISTICS:
-                    self.idle_logistics.append(vehicle.id)
+                    self.idle_logistics.add(vehicle.id)
     
+    def _build_travel_time_tables(self) -> None:
+        """Precompute travel time matrices for each distinct fleet speed.
+
+        Vehicles only ever travel at their laden or unladen speed, so the
+        handful of distinct speeds in the fleet covers every routing query.
+        """
+        speeds = set()
+        for vruntime in self.vehicles.values():
+            speeds.add(vruntime.vehicle_type.speed.laden_kmh)
+            speeds.add(vruntime.vehicle_type.speed.unladen_kmh)
+
+        self._travel_mins = {
+            speed: self._shortest_km / speed * 60 for speed in speeds
+        }
+
     def _start_demand_generators(self) -> None:
         """Start processes that generate demand events."""
         if self.scenario.demand.mode == DemandMode.MANUAL:
             self.env.process(self._manual_demand_generator())
         elif self.scenario.demand.mode == DemandMode.RATE_BASED:
+            duration_mins = self.scenario.config.duration_hours * 60
             for rate_config in self.scenario.demand.rate_based:
-                self.env.process(self._rate_based_generator(rate_config))
+                arrivals = rate_config.sample_arrival_times(self._np_rng, duration_mins)
+                self.env.process(self._rate_based_generator(rate_config, arrivals))
     
     def _start_vehicle_processes(self) -> None:
         """Start vehicle behaviour processes."""
@@ -304,13 +394,7 @@ class SimulationEngine:
     
     def _manual_demand_generator(self) -> Generator:
         """Generate demand events from manual event list."""
-        # Sort events by time
-        events = sorted(
-            self.scenario.demand.manual_events,
-            key=lambda e: e.time_mins
-        )
-
-        for event in events:
+        for event in self.scenario.demand.get_manual_events_sorted():
             # Wait until event time
             if event.time_mins > self.env.now:
                 yield self.env.timeout(event.time_mins - self.env.now)
@@ -338,27 +422,17 @@ class SimulationEngine:
                     priority=event.priority,
                 )
     
-    def _rate_based_generator(self, config) -> Generator:
-        """Generate demand events from Poisson process."""
-        # Wait until active period starts
-        if config.active_from_mins > 0:
-            yield self.env.timeout(config.active_from_mins)
+    def _rate_based_generator(self, config, arrivals: np.ndarray) -> Generator:
+        """Generate demand events at pre-sampled Poisson arrival times."""
+        # Priority table is fixed for the generator's lifetime
+        priorities = [Priority(p) for p in config.priority_weights]
+        cum_weights = list(itertools.accumulate(config.priority_weights.values()))
         
-        # Calculate mean inter-arrival time
-        mean_interval = 60.0 / config.rate_per_hour  # minutes
-        
-        end_time = config.active_until_mins or (self.scenario.config.duration_hours * 60)
-        
-        while self.env.now < end_time:
-            # Exponential inter-arrival
-            interval = self._rng.expovariate(1.0 / mean_interval)
-            yield self.env.timeout(interval)
-            
-            if self.env.now >= end_time:
-                break
+        for arrival_time in arrivals.tolist():
+            yield self.env.timeout(arrival_time - self.env.now)
             
             # Sample priority
-            priority = self._sample_priority(config.priority_weights)
+            priority = self._sample_priority(priorities, cum_weights)
             
             # Sample quantity
             qty = self._rng.randint(config.min_quantity, config.max_quantity)
@@ -371,12 +445,13 @@ class SimulationEngine:
                         priority=priority,
                     )
     
-    def _sample_priority(self, weights: dict[int, float]) -> Priority:
-        """Sample a priority level from weight distribution."""
-        priorities = list(weights.keys())
-        probs = list(weights.values())
-        chosen = self._rng.choices(priorities, weights=probs, k=1)[0]
-        return Priority(chosen)
+    def _sample_priority(
+        self,
+        priorities: list[Priority],
+        cum_weights: list[float],
+    ) -> Priority:
+        """Sample a priority level from a cumulative weight distribution."""
+        return self._rng.choices(priorities, cum_weights=cum_weights, k=1)[0]
     
     def _generate_casualty(
         self,
@@ -409,6 +484,7 @@ class SimulationEngine:
         # Add to queue
         request = CasualtyRequest(
             priority=priority.value,
+            seq=next(self._request_seq),
             time_requested=self.env.now,
             casualty=casualty,
             location=location,
@@ -459,6 +535,7 @@ class SimulationEngine:
         # Add to recovery queue
         request = RecoveryRequest(
             priority=priority.value,
+            seq=next(self._request_seq),
             time_requested=self.env.now,
             breakdown=breakdown,
             location=location,
@@ -497,6 +574,7 @@ class SimulationEngine:
         # Add to delivery queue
         request = AmmoDeliveryRequest(
             priority=priority.value,
+            seq=next(self._request_seq),
             time_requested=self.env.now,
             ammo_request=ammo_req,
             location=location,
@@ -657,7 +735,7 @@ class SimulationEngine:
             # Return to base or stay at medical facility
             # For MVP: ambulance stays at delivery location, ready for next call
             vruntime.state = VehicleState.IDLE
-            self.idle_ambulances.append(vehicle_id)
+            self.idle_ambulances.add(vehicle_id)
             
             self.event_log.log_event(
                 time_mins=self.env.now,
@@ -668,7 +746,7 @@ class SimulationEngine:
     
     def _treatment_process(self, casualty: Casualty, node_id: str) -> Generator:
         """Process casualty through treatment at medical facility."""
-        node = self.scenario.get_node_by_id(node_id)
+        node = self._nodes_by_id.get(node_id)
         if node is None:
             return
         
@@ -724,7 +802,7 @@ class SimulationEngine:
                 yield self.env.timeout(1)
 
             # Check if this recovery vehicle is available
-            if vehicle_id not in self.idle_recovery.get(tow_class, []):
+            if vehicle_id not in self.idle_recovery.get(tow_class, ()):
                 yield self.env.timeout(1)
                 continue
 
@@ -816,7 +894,7 @@ class SimulationEngine:
             if workshop_node is None:
                 # No workshop - return broken vehicle to current location
                 vruntime.state = VehicleState.IDLE
-                self.idle_recovery[tow_class].append(vehicle_id)
+                self.idle_recovery[tow_class].add(vehicle_id)
                 continue
 
             # Travel to workshop (laden/towing)
@@ -859,7 +937,7 @@ class SimulationEngine:
 
             # Recovery vehicle is now idle at workshop
             vruntime.state = VehicleState.IDLE
-            self.idle_recovery[tow_class].append(vehicle_id)
+            self.idle_recovery[tow_class].add(vehicle_id)
 
             self.event_log.log_event(
                 time_mins=self.env.now,
@@ -870,7 +948,7 @@ class SimulationEngine:
 
     def _repair_process(self, breakdown: Breakdown, node_id: str) -> Generator:
         """Process vehicle through repair at workshop."""
-        node = self.scenario.get_node_by_id(node_id)
+        node = self._nodes_by_id.get(node_id)
         if node is None:
             return
 
@@ -961,7 +1039,7 @@ class SimulationEngine:
                     entity_id=ammo_req.id,
                     location=delivery_location,
                 )
-                self.idle_logistics.append(vehicle_id)
+                self.idle_logistics.add(vehicle_id)
                 vruntime.state = VehicleState.IDLE
                 continue
 
@@ -1083,7 +1161,7 @@ class SimulationEngine:
 
             # Vehicle is now idle at delivery location
             vruntime.state = VehicleState.IDLE
-            self.idle_logistics.append(vehicle_id)
+            self.idle_logistics.add(vehicle_id)
 
             self.event_log.log_event(
                 time_mins=self.env.now,
@@ -1105,15 +1183,12 @@ class SimulationEngine:
 
         role = vruntime.vehicle_type.role
         if role == VehicleRole.AMBULANCE:
-            if vehicle_id not in self.idle_ambulances:
-                self.idle_ambulances.append(vehicle_id)
+            self.idle_ambulances.add(vehicle_id)
         elif role == VehicleRole.RECOVERY:
             tow_class = vruntime.vehicle_type.tow_capacity_class.value if vruntime.vehicle_type.tow_capacity_class else "light"
-            if vehicle_id not in self.idle_recovery[tow_class]:
-                self.idle_recovery[tow_class].append(vehicle_id)
+            self.idle_recovery[tow_class].add(vehicle_id)
         elif role == VehicleRole.AMMO_LOGISTICS:
-            if vehicle_id not in self.idle_logistics:
-                self.idle_logistics.append(vehicle_id)
+            self.idle_logistics.add(vehicle_id)
 
     def _remove_vehicle_from_service(self, vehicle_id: str) -> None:
         """Remove a vehicle from idle lists (for breakdown/rest)."""
@@ -1123,15 +1198,13 @@ class SimulationEngine:
 
         role = vruntime.vehicle_type.role
         if role == VehicleRole.AMBULANCE:
-            if vehicle_id in self.idle_ambulances:
-                self.idle_ambulances.remove(vehicle_id)
+            self.idle_ambulances.discard(vehicle_id)
         elif role == VehicleRole.RECOVERY:
             tow_class = vruntime.vehicle_type.tow_capacity_class.value if vruntime.vehicle_type.tow_capacity_class else "light"
-            if vehicle_id in self.idle_recovery.get(tow_class, []):
-                self.idle_recovery[tow_class].remove(vehicle_id)
+            if tow_class in self.idle_recovery:
+                self.idle_recovery[tow_class].discard(vehicle_id)
         elif role == VehicleRole.AMMO_LOGISTICS:
-            if vehicle_id in self.idle_logistics:
-                self.idle_logistics.remove(vehicle_id)
+            self.idle_logistics.discard(vehicle_id)
 
     # === Extended Operations Processes (Phase 4) ===
 
@@ -1269,100 +1342,43 @@ class SimulationEngine:
         to_node: str,
         speed_kmh: float,
     ) -> float:
-        """Calculate travel time in minutes between two nodes."""
+        """Calculate travel time in minutes between two nodes.
+
+        Returns infinity if no path exists.
+        """
         if from_node == to_node:
             return 0.0
-        
-        try:
-            # Use NetworkX shortest path
-            path = nx.shortest_path(
-                self.graph,
-                from_node,
-                to_node,
-                weight="effective_km",
-            )
-            
-            # Sum distances along path
-            total_km = 0.0
-            for i in range(len(path) - 1):
-                edge_data = self.graph.edges[path[i], path[i + 1]]
-                total_km += edge_data["effective_km"]
-            
-            # Convert to time
-            time_hours = total_km / speed_kmh
-            return time_hours * 60  # minutes
-            
-        except nx.NetworkXNoPath:
-            # No path exists - return large value
-            return float("inf")
-    
+
+        i, j = self.node_idx[from_node], self.node_idx[to_node]
+
+        table = self._travel_mins.get(speed_kmh)
+        if table is not None:
+            return float(table[i, j])
+
+        return float(self._shortest_km[i, j]) / speed_kmh * 60  # minutes
+
+    def _find_nearest(self, from_node: str, mask: np.ndarray) -> Optional[str]:
+        """Find the nearest reachable node selected by ``mask``."""
+        if not mask.any():
+            return None
+
+        row = np.where(mask, self._shortest_km[self.node_idx[from_node]], np.inf)
+        best = int(np.argmin(row))
+        if not np.isfinite(row[best]):
+            return None
+        return self._node_ids[best]
+
     def _find_nearest_medical(self, from_node: str) -> Optional[str]:
         """Find nearest medical facility from given node."""
-        medical_types = {NodeType.MEDICAL_ROLE1, NodeType.MEDICAL_ROLE2}
-        
-        best_node = None
-        best_distance = float("inf")
-        
-        for node in self.scenario.nodes:
-            if node.type in medical_types:
-                try:
-                    dist = nx.shortest_path_length(
-                        self.graph,
-                        from_node,
-                        node.id,
-                        weight="effective_km",
-                    )
-                    if dist < best_distance:
-                        best_distance = dist
-                        best_node = node.id
-                except nx.NetworkXNoPath:
-                    continue
-        
-        return best_node
+        return self._find_nearest(from_node, self._medical_mask)
 
     def _find_nearest_workshop(self, from_node: str) -> Optional[str]:
         """Find nearest repair workshop from given node."""
-        best_node = None
-        best_distance = float("inf")
-
-        for node in self.scenario.nodes:
-            if node.type == NodeType.REPAIR_WORKSHOP:
-                try:
-                    dist = nx.shortest_path_length(
-                        self.graph,
-                        from_node,
-                        node.id,
-                        weight="effective_km",
-                    )
-                    if dist < best_distance:
-                        best_distance = dist
-                        best_node = node.id
-                except nx.NetworkXNoPath:
-                    continue
-
-        return best_node
+        return self._find_nearest(from_node, self._workshop_mask)
 
     def _find_nearest_ammo_point(self, from_node: str) -> Optional[str]:
         """Find nearest ammunition supply point from given node."""
-        best_node = None
-        best_distance = float("inf")
-
-        for node in self.scenario.nodes:
-            if node.type == NodeType.AMMO_POINT:
-                try:
-                    dist = nx.shortest_path_length(
-                        self.graph,
-                        from_node,
-                        node.id,
-                        weight="effective_km",
-                    )
-                    if dist < best_distance:
-                        best_distance = dist
-                        best_node = node.id
-                except nx.NetworkXNoPath:
-                    continue
-
-        return best_node
+        return self._find_nearest(from_node, self._ammo_point_mask)
 
     # === Statistics ===
     
@@ -4,13 +4,26 @@ All simulation events are recorded to an EventLog, which can be
 queried for KPI calculation and exported for analysis.
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from pj_ogun.models.enums import EventType, Priority
 
+# Event types in enum order; an event's type code is its index here
+_EVENT_TYPES: tuple[EventType, ...] = tuple(EventType)
+_EVENT_TYPE_CODES: dict[EventType, int] = {t: i for i, t in enumerate(_EVENT_TYPES)}
 
-@dataclass
+
+def _time_column(records: list, attr: str):
+    """Collect an optional timestamp attribute as a float64 array (None -> NaN)."""
+    import numpy as np
+
+    return np.array([getattr(r, attr) for r in records], dtype=np.float64)
+
+
+@dataclass(slots=True)
 class SimEvent:
     """A single simulation event.
     
@@ -44,7 +57,7 @@ class SimEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Casualty:
     """Tracks a casualty through the evacuation chain.
 
@@ -109,7 +122,7 @@ class Casualty:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Breakdown:
     """Tracks a vehicle breakdown through recovery and repair.
 
@@ -190,7 +203,7 @@ class Breakdown:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class AmmoRequest:
     """Tracks an ammunition resupply request through fulfillment.
 
@@ -260,10 +273,21 @@ class EventLog:
     The EventLog is the primary output of a simulation run.
     It can be queried for specific event types, filtered by
     time range, and exported for analysis.
+
+    Alongside the event objects the log keeps typed columns of event
+    times and type codes, so time filters and exports work on
+    contiguous arrays instead of walking every event.
     """
 
     def __init__(self):
         self._events: list[SimEvent] = []
+        self._events_view: Optional[tuple[SimEvent, ...]] = None
+        self._times = array("d")
+        self._type_codes = array("B")
+        self._in_time_order: bool = True
+        self._events_by_type: dict[EventType, list[SimEvent]] = {}
+        self._events_by_entity: dict[str, list[SimEvent]] = {}
+        self._events_by_location: dict[Optional[str], list[SimEvent]] = {}
         self._casualties: dict[str, Casualty] = {}
         self._casualty_counter: int = 0
         self._breakdowns: dict[str, Breakdown] = {}
@@ -273,7 +297,19 @@ class EventLog:
 
     def log(self, event: SimEvent) -> None:
         """Record an event."""
+        if self._times and event.time_mins < self._times[-1]:
+            self._in_time_order = False
         self._events.append(event)
+        self._events_view = None
+        self._times.append(event.time_mins)
+        self._type_codes.append(_EVENT_TYPE_CODES[event.event_type])
+        self._index(event)
+
+    def _index(self, event: SimEvent) -> None:
+        """Add an event to the per-type, entity and location indexes."""
+        self._events_by_type.setdefault(event.event_type, []).append(event)
+        self._events_by_entity.setdefault(event.entity_id, []).append(event)
+        self._events_by_location.setdefault(event.location, []).append(event)
 
     def log_event(
         self,
@@ -394,33 +430,74 @@ class EventLog:
     
     # === Event Queries ===
     
+    def _sort_by_time(self) -> None:
+        """Stable-sort events, their columns and indexes by time, if needed.
+
+        Events are normally logged at the current simulation time, so
+        this only does work after an out-of-order ``log`` call. Every
+        query calls it first, so all of them return chronological order.
+        """
+        if self._in_time_order:
+            return
+        import numpy as np
+
+        times = np.frombuffer(self._times, dtype=np.float64)
+        order = np.argsort(times, kind="stable")
+        codes = np.frombuffer(self._type_codes, dtype=np.uint8)
+        self._events = [self._events[i] for i in order]
+        self._times = array("d", times[order].tobytes())
+        self._type_codes = array("B", codes[order].tobytes())
+        self._events_view = None
+
+        for index in (self._events_by_type, self._events_by_entity, self._events_by_location):
+            index.clear()
+        for event in self._events:
+            self._index(event)
+
+        self._in_time_order = True
+
     @property
-    def events(self) -> list[SimEvent]:
-        """All events in chronological order."""
-        return sorted(self._events, key=lambda e: e.time_mins)
+    def events(self) -> tuple[SimEvent, ...]:
+        """All events in chronological order (stable for equal times).
+
+        The tuple is built once and reused until the next ``log`` call.
+        """
+        self._sort_by_time()
+        if self._events_view is None:
+            self._events_view = tuple(self._events)
+        return self._events_view
     
     def filter_by_type(self, event_type: EventType) -> list[SimEvent]:
-        """Get events of a specific type."""
-        return [e for e in self._events if e.event_type == event_type]
+        """Get events of a specific type, in time order."""
+        self._sort_by_time()
+        return list(self._events_by_type.get(event_type, ()))
     
     def filter_by_entity(self, entity_id: str) -> list[SimEvent]:
-        """Get events for a specific entity."""
-        return [e for e in self._events if e.entity_id == entity_id]
+        """Get events for a specific entity, in time order."""
+        self._sort_by_time()
+        return list(self._events_by_entity.get(entity_id, ()))
     
     def filter_by_location(self, location: str) -> list[SimEvent]:
-        """Get events at a specific location."""
-        return [e for e in self._events if e.location == location]
+        """Get events at a specific location, in time order."""
+        self._sort_by_time()
+        return list(self._events_by_location.get(location, ()))
     
     def filter_by_time(
         self, 
         start_mins: float = 0, 
         end_mins: Optional[float] = None,
     ) -> list[SimEvent]:
-        """Get events within a time range."""
-        events = [e for e in self._events if e.time_mins >= start_mins]
-        if end_mins is not None:
-            events = [e for e in events if e.time_mins <= end_mins]
-        return events
+        """Get events within a time range (both ends inclusive), in time order.
+
+        The range is located by binary search on the sorted time column.
+        """
+        self._sort_by_time()
+        lo = bisect_left(self._times, start_mins)
+        hi = (
+            len(self._times) if end_mins is None
+            else bisect_right(self._times, end_mins, lo)
+        )
+        return self._events[lo:hi]
     
     # === Export ===
     
@@ -429,88 +506,182 @@ class EventLog:
         return [e.to_dict() for e in self.events]
     
     def to_dataframe(self):
-        """Export events to pandas DataFrame."""
+        """Export events to pandas DataFrame.
+
+        ``time_mins`` and ``event_type`` come straight from the typed
+        columns; ``event_type`` is categorical over the closed EventType
+        enum. Rows are in chronological order (stable for equal times)
+        and detail columns appear in first-seen order.
+        """
+        import numpy as np
         import pandas as pd
-        return pd.DataFrame(self.to_list())
+
+        events = self.events
+
+        columns: dict[str, Any] = {
+            "time_mins": np.array(self._times, dtype=np.float64),
+            "event_type": pd.Categorical.from_codes(
+                np.array(self._type_codes, dtype=np.uint8),
+                categories=[t.value for t in _EVENT_TYPES],
+            ),
+            "entity_id": [e.entity_id for e in events],
+            "location": [e.location for e in events],
+        }
+
+        detail_keys = dict.fromkeys(k for e in events for k in e.details)
+        for key in detail_keys:
+            columns[key] = [e.details.get(key) for e in events]
+
+        return pd.DataFrame(columns)
     
+    def to_arrow(self):
+        """Export events to a pyarrow Table.
+
+        Same columns as ``to_dataframe``. ``time_mins`` and ``event_type``
+        are built straight from the typed columns, ``event_type`` as a
+        dictionary array over the EventType values; only the free-form
+        detail columns go through pandas. Requires the ``parquet`` extra.
+        """
+        import numpy as np
+        import pandas as pd
+        import pyarrow as pa
+
+        events = self.events
+
+        table = pa.table({
+            "time_mins": pa.array(np.array(self._times, dtype=np.float64)),
+            "event_type": pa.DictionaryArray.from_arrays(
+                pa.array(np.array(self._type_codes, dtype=np.int8)),
+                pa.array([t.value for t in _EVENT_TYPES], type=pa.string()),
+            ),
+            "entity_id": pa.array([e.entity_id for e in events], type=pa.string()),
+            "location": pa.array([e.location for e in events], type=pa.string()),
+        })
+
+        detail_keys = dict.fromkeys(k for e in events for k in e.details)
+        if detail_keys:
+            details = pa.Table.from_pandas(
+                pd.DataFrame({key: [e.details.get(key) for e in events] for key in detail_keys}),
+                preserve_index=False,
+            )
+            for name, column in zip(details.column_names, details.columns):
+                table = table.append_column(name, column)
+
+        return table
+
+    def to_parquet(self, path, compression: str = "zstd") -> None:
+        """Write events to a Parquet file. Requires the ``parquet`` extra."""
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, compression=compression)
+
     def casualties_to_dataframe(self):
-        """Export casualty tracking to DataFrame."""
+        """Export casualty tracking to DataFrame.
+
+        Built column-wise: timestamps become float64 arrays (NaN where
+        not yet reached) and derived durations are computed on whole
+        columns rather than per casualty.
+        """
+        import numpy as np
         import pandas as pd
 
-        records = []
-        for cas in self._casualties.values():
-            records.append({
-                "id": cas.id,
-                "priority": cas.priority.value,
-                "origin_node": cas.origin_node,
-                "mechanism": cas.mechanism,
-                "time_generated": cas.time_generated,
-                "time_collected": cas.time_collected,
-                "time_delivered": cas.time_delivered,
-                "time_treatment_started": cas.time_treatment_started,
-                "time_treatment_completed": cas.time_treatment_completed,
-                "collected_by": cas.collected_by,
-                "delivered_to": cas.delivered_to,
-                "wait_time_mins": cas.wait_time_mins,
-                "evacuation_time_mins": cas.evacuation_time_mins,
-                "total_time_mins": cas.total_time_mins,
-            })
-
-        return pd.DataFrame(records)
+        cas = list(self._casualties.values())
+
+        time_generated = _time_column(cas, "time_generated")
+        time_collected = _time_column(cas, "time_collected")
+        time_delivered = _time_column(cas, "time_delivered")
+        time_treatment_completed = _time_column(cas, "time_treatment_completed")
+
+        return pd.DataFrame({
+            "id": [c.id for c in cas],
+            "priority": np.array([c.priority for c in cas], dtype=np.int8),
+            "origin_node": [c.origin_node for c in cas],
+            "mechanism": [c.mechanism for c in cas],
+            "time_generated": time_generated,
+            "time_collected": time_collected,
+            "time_delivered": time_delivered,
+            "time_treatment_started": _time_column(cas, "time_treatment_started"),
+            "time_treatment_completed": time_treatment_completed,
+            "collected_by": [c.collected_by for c in cas],
+            "delivered_to": [c.delivered_to for c in cas],
+            "wait_time_mins": time_collected - time_generated,
+            "evacuation_time_mins": time_delivered - time_generated,
+            "total_time_mins": time_treatment_completed - time_generated,
+        })
 
     def breakdowns_to_dataframe(self):
-        """Export breakdown tracking to DataFrame."""
+        """Export breakdown tracking to DataFrame.
+
+        Built column-wise like ``casualties_to_dataframe``.
+        """
+        import numpy as np
         import pandas as pd
 
-        records = []
-        for bd in self._breakdowns.values():
-            records.append({
-                "id": bd.id,
-                "vehicle_id": bd.vehicle_id,
-                "vehicle_class": bd.vehicle_class,
-                "location": bd.location,
-                "priority": bd.priority.value,
-                "time_occurred": bd.time_occurred,
-                "time_recovery_dispatched": bd.time_recovery_dispatched,
-                "time_recovery_arrived": bd.time_recovery_arrived,
-                "time_hookup_completed": bd.time_hookup_completed,
-                "time_arrived_workshop": bd.time_arrived_workshop,
-                "time_repair_started": bd.time_repair_started,
-                "time_repair_completed": bd.time_repair_completed,
-                "recovered_by": bd.recovered_by,
-                "repaired_at": bd.repaired_at,
-                "response_time_mins": bd.response_time_mins,
-                "recovery_time_mins": bd.recovery_time_mins,
-                "repair_time_mins": bd.repair_time_mins,
-                "total_downtime_mins": bd.total_downtime_mins,
-            })
-
-        return pd.DataFrame(records)
+        bds = list(self._breakdowns.values())
+
+        time_occurred = _time_column(bds, "time_occurred")
+        time_recovery_arrived = _time_column(bds, "time_recovery_arrived")
+        time_arrived_workshop = _time_column(bds, "time_arrived_workshop")
+        time_repair_started = _time_column(bds, "time_repair_started")
+        time_repair_completed = _time_column(bds, "time_repair_completed")
+
+        return pd.DataFrame({
+            "id": [bd.id for bd in bds],
+            "vehicle_id": [bd.vehicle_id for bd in bds],
+            "vehicle_class": [bd.vehicle_class for bd in bds],
+            "location": [bd.location for bd in bds],
+            "priority": np.array([bd.priority for bd in bds], dtype=np.int8),
+            "time_occurred": time_occurred,
+            "time_recovery_dispatched": _time_column(bds, "time_recovery_dispatched"),
+            "time_recovery_arrived": time_recovery_arrived,
+            "time_hookup_completed": _time_column(bds, "time_hookup_completed"),
+            "time_arrived_workshop": time_arrived_workshop,
+            "time_repair_started": time_repair_started,
+            "time_repair_completed": time_repair_completed,
+            "recovered_by": [bd.recovered_by for bd in bds],
+            "repaired_at": [bd.repaired_at for bd in bds],
+            "response_time_mins": time_recovery_arrived - time_occurred,
+            "recovery_time_mins": time_arrived_workshop - time_occurred,
+            "repair_time_mins": time_repair_completed - time_repair_started,
+            "total_downtime_mins": time_repair_completed - time_occurred,
+        })
 
     def ammo_requests_to_dataframe(self):
-        """Export ammo request tracking to DataFrame."""
+        """Export ammo request tracking to DataFrame.
+
+        Built column-wise like ``casualties_to_dataframe``.
+        """
+        import numpy as np
         import pandas as pd
 
-        records = []
-        for req in self._ammo_requests.values():
-            records.append({
-                "id": req.id,
-                "location": req.location,
-                "quantity_requested": req.quantity_requested,
-                "quantity_delivered": req.quantity_delivered,
-                "priority": req.priority.value,
-                "time_requested": req.time_requested,
-                "time_dispatched": req.time_dispatched,
-                "time_loaded": req.time_loaded,
-                "time_delivered": req.time_delivered,
-                "fulfilled_by": req.fulfilled_by,
-                "loaded_from": req.loaded_from,
-                "wait_time_mins": req.wait_time_mins,
-                "delivery_time_mins": req.delivery_time_mins,
-                "is_fulfilled": req.is_fulfilled,
-            })
-
-        return pd.DataFrame(records)
+        reqs = list(self._ammo_requests.values())
+
+        quantity_requested = np.array(
+            [r.quantity_requested for r in reqs], dtype=np.int64
+        )
+        quantity_delivered = np.array(
+            [r.quantity_delivered for r in reqs], dtype=np.int64
+        )
+        time_requested = _time_column(reqs, "time_requested")
+        time_dispatched = _time_column(reqs, "time_dispatched")
+        time_delivered = _time_column(reqs, "time_delivered")
+
+        return pd.DataFrame({
+            "id": [r.id for r in reqs],
+            "location": [r.location for r in reqs],
+            "quantity_requested": quantity_requested,
+            "quantity_delivered": quantity_delivered,
+            "priority": np.array([r.priority for r in reqs], dtype=np.int8),
+            "time_requested": time_requested,
+            "time_dispatched": time_dispatched,
+            "time_loaded": _time_column(reqs, "time_loaded"),
+            "time_delivered": time_delivered,
+            "fulfilled_by": [r.fulfilled_by for r in reqs],
+            "loaded_from": [r.loaded_from for r in reqs],
+            "wait_time_mins": time_dispatched - time_requested,
+            "delivery_time_mins": time_delivered - time_requested,
+            "is_fulfilled": quantity_delivered >= quantity_requested,
+        })
 
     def __len__(self) -> int:
         return len(self._events)
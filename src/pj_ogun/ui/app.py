@@ -23,7 +23,7 @@ from pj_ogun.ui.components.canvas import render_network_canvas, render_node_pale
 from pj_ogun.ui.components.node_panel import render_node_panel
 from pj_ogun.ui.components.vehicle_builder import render_vehicle_builder
 from pj_ogun.ui.components.demand_builder import render_demand_builder
-from pj_ogun.ui.components.replay import render_replay_tab
+from pj_ogun.ui.components.replay import clear_replay_cache, render_replay_tab
 from pj_ogun.ui.state.canvas_state import (
     get_canvas_state,
     scenario_to_flow_state,
@@ -247,7 +247,9 @@ def load_scenario_template(template_name: str) -> None:
     canvas_state = get_canvas_state()
 
     canvas_state.flow_state = flow_state
-    canvas_state.node_data = node_data
+    canvas_state.replace_node_data(node_data)
+    canvas_state.edge_distances.clear()
+    canvas_state.node_type_counters.clear()
     canvas_state.scenario_name = template["name"]
 
     # Load vehicles
@@ -608,7 +610,9 @@ def _apply_scenario_data(canvas_state, data: dict) -> None:
     # Convert to canvas state
     flow_state, node_data = scenario_to_flow_state(data)
     canvas_state.flow_state = flow_state
-    canvas_state.node_data = node_data
+    canvas_state.replace_node_data(node_data)
+    canvas_state.edge_distances.clear()
+    canvas_state.node_type_counters.clear()
     canvas_state.scenario_name = data.get("name", "Loaded Scenario")
 
     # Load vehicles
@@ -762,9 +766,8 @@ def render_simulate_tab():
                 st.session_state["resupply_kpis"] = resupply_kpis
                 st.session_state["kpis"] = medevac_kpis
 
-                # Clear replay graph cache
-                if "replay_graph" in st.session_state:
-                    del st.session_state["replay_graph"]
+                # Clear replay caches
+                clear_replay_cache()
 
                 # Summary
                 cas_count = len(event_log.casualties) if hasattr(event_log, 'casualties') else 0
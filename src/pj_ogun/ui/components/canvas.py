@@ -19,6 +19,9 @@ from pj_ogun.ui.state.canvas_state import (
     get_node_position,
 )
 
+# Keyword arguments accepted by the installed streamlit_flow version
+_FLOW_SUPPORTED_KWARGS = frozenset(inspect.signature(streamlit_flow).parameters)
+
 
 def render_node_palette() -> None:
     """Render the node type selection palette."""
@@ -77,12 +80,8 @@ def render_network_canvas() -> None:
         canvas_state.node_type_to_add = None
 
         # Generate unique id and name
-        existing_ids = {n.id for n in canvas_state.flow_state.nodes}
-        base_name = node_type.value
-        counter = 1
-        while f"{base_name}_{counter}" in existing_ids:
-            counter += 1
-        node_id = f"{base_name}_{counter}"
+        counter = canvas_state.next_node_number(node_type)
+        node_id = f"{node_type.value}_{counter}"
         name = f"{NODE_CONFIG.get(node_type, {}).get('label', node_type.value)} {counter}"
 
         # Position based on existing nodes (offset from last or center)
@@ -99,11 +98,11 @@ def render_network_canvas() -> None:
         canvas_state.flow_state.nodes.append(flow_node)
 
         # Create node data
-        canvas_state.node_data[node_id] = NodeData(
+        canvas_state.set_node_data(NodeData(
             id=node_id,
             name=name,
             node_type=node_type,
-        )
+        ))
 
         # Select the new node
         canvas_state.selected_node_id = node_id
@@ -115,7 +114,9 @@ def render_network_canvas() -> None:
     with col1:
         if st.button("Clear All", type="secondary"):
             canvas_state.flow_state = StreamlitFlowState(nodes=[], edges=[])
-            canvas_state.node_data = {}
+            canvas_state.replace_node_data([])
+            canvas_state.edge_distances.clear()
+            canvas_state.node_type_counters.clear()
             canvas_state.selected_node_id = None
             st.rerun()
 
@@ -132,8 +133,9 @@ def render_network_canvas() -> None:
                 if e.source != canvas_state.selected_node_id
                 and e.target != canvas_state.selected_node_id
             ]
+            canvas_state.prune_edge_distances()
             # Remove node data
-            canvas_state.node_data.pop(canvas_state.selected_node_id, None)
+            canvas_state.remove_node_data(canvas_state.selected_node_id)
             canvas_state.selected_node_id = None
             st.rerun()
 
@@ -158,8 +160,9 @@ def render_network_canvas() -> None:
             "max_zoom": 4,
         }
         # Filter out kwargs not supported by the installed streamlit_flow version.
-        supported = set(inspect.signature(streamlit_flow).parameters)
-        flow_kwargs = {k: v for k, v in flow_kwargs.items() if k in supported}
+        flow_kwargs = {
+            k: v for k, v in flow_kwargs.items() if k in _FLOW_SUPPORTED_KWARGS
+        }
         updated_state = streamlit_flow(
             "scenario_canvas",
             canvas_state.flow_state,
@@ -174,24 +177,22 @@ def render_network_canvas() -> None:
                     if canvas_state.selected_node_id != node.id:
                         canvas_state.selected_node_id = node.id
 
-            # Check for new edges
-            new_edge_ids = {e.id for e in updated_state.edges}
-            old_edge_ids = {e.id for e in canvas_state.flow_state.edges}
-
-            for edge in updated_state.edges:
-                if edge.id not in old_edge_ids:
-                    # New edge created - add distance label
-                    edge.label = "5.0 km"
-
-            # Sync node positions (user may have dragged)
-            for updated_node in updated_state.nodes:
-                for i, existing_node in enumerate(canvas_state.flow_state.nodes):
-                    if existing_node.id == updated_node.id:
-                        canvas_state.flow_state.nodes[i] = updated_node
-                        break
+            # Check for new edges; most reruns change no edges, so skip the scan
+            edges_changed = len(updated_state.edges) != len(canvas_state.flow_state.edges)
+            if edges_changed:
+                old_edge_ids = {e.id for e in canvas_state.flow_state.edges}
+                for edge in updated_state.edges:
+                    if edge.id not in old_edge_ids:
+                        # New edge created - default distance and label
+                        canvas_state.set_edge_distance(edge, 5.0)
 
+            # Adopt the returned state wholesale; it carries dragged node positions
             canvas_state.flow_state = updated_state
 
+            # Drop distances of edges deleted on the canvas
+            if edges_changed:
+                canvas_state.prune_edge_distances()
+
     else:
         st.info("""
         **Getting started:** Click a location type on the left panel to add your first node.
@@ -201,7 +202,7 @@ def render_network_canvas() -> None:
 
     # Show selected node info
     if canvas_state.selected_node_id:
-        node_data = canvas_state.node_data.get(canvas_state.selected_node_id)
+        node_data = canvas_state.get_node_data(canvas_state.selected_node_id)
         if node_data:
             st.success(f"Selected: **{node_data.name}** - Edit properties in the right panel")
 
@@ -217,18 +218,14 @@ def render_edge_editor() -> None:
     st.subheader("Route Distances")
     st.caption("Set travel distances between locations (affects vehicle travel time)")
 
-    for i, edge in enumerate(canvas_state.flow_state.edges):
+    for edge in canvas_state.flow_state.edges:
         col1, col2 = st.columns([2, 1])
 
         with col1:
             st.text(f"{edge.source} -> {edge.target}")
 
         with col2:
-            # Extract current distance
-            try:
-                current = float(edge.label.replace(" km", "")) if edge.label else 5.0
-            except (ValueError, AttributeError):
-                current = 5.0
+            current = canvas_state.get_edge_distance(edge)
 
             new_dist = st.number_input(
                 "km",
@@ -241,4 +238,4 @@ def render_edge_editor() -> None:
             )
 
             if new_dist != current:
-                canvas_state.flow_state.edges[i].label = f"{new_dist:.1f} km"
+                canvas_state.set_edge_distance(edge, new_dist)
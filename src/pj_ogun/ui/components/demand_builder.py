@@ -202,7 +202,7 @@ def render_rate_based(canvas_state, node_ids: list[str]) -> None:
     # Filter to casualty-generating nodes (typically combat positions)
     combat_nodes = []
     for node_id in node_ids:
-        node_data = canvas_state.node_data.get(node_id)
+        node_data = canvas_state.get_node_data(node_id)
         if node_data and node_data.node_type.value in ("combat", "forward_arming"):
             combat_nodes.append(node_id)
 
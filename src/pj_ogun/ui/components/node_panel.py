@@ -23,7 +23,7 @@ def render_node_panel() -> None:
         st.caption("Each location type has specific settings that affect how the simulation handles events there.")
         return
 
-    node_data = canvas_state.node_data.get(canvas_state.selected_node_id)
+    node_data = canvas_state.get_node_data(canvas_state.selected_node_id)
     if not node_data:
         st.warning("Node data not found.")
         return
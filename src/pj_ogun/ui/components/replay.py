@@ -8,14 +8,19 @@ Phase 5: Pre-computed replay from EventLog with:
 
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
 
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-import networkx as nx
 
 from pj_ogun.models.enums import EventType, VehicleRole, VehicleState
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+T = TypeVar("T")
+
 
 # State colours for vehicles
 STATE_COLORS = {
@@ -31,6 +36,25 @@ STATE_COLORS = {
     VehicleState.MAINTENANCE: "#888888",
 }
 
+# Vehicle state after each state-changing event type
+_EVENT_TO_STATE = {
+    EventType.VEHICLE_DISPATCHED: VehicleState.TRANSITING_UNLADEN,
+    EventType.VEHICLE_ARRIVED: VehicleState.IDLE,
+    EventType.LOADING_STARTED: VehicleState.LOADING,
+    EventType.LOADING_COMPLETED: VehicleState.TRANSITING_LADEN,
+    EventType.UNLOADING_STARTED: VehicleState.UNLOADING,
+    EventType.UNLOADING_COMPLETED: VehicleState.IDLE,
+    EventType.VEHICLE_RETURNED: VehicleState.IDLE,
+    EventType.HOOKUP_STARTED: VehicleState.HOOKUP,
+    EventType.HOOKUP_COMPLETED: VehicleState.TRANSITING_LADEN,
+    EventType.CREW_REST_STARTED: VehicleState.CREW_REST,
+    EventType.CREW_REST_ENDED: VehicleState.IDLE,
+}
+
+# Vehicle states by integer code, for the precomputed replay state column
+_VEHICLE_STATES = tuple(VehicleState)
+_STATE_CODES = {state: code for code, state in enumerate(_VEHICLE_STATES)}
+
 # Role symbols for vehicles
 ROLE_SYMBOLS = {
     VehicleRole.AMBULANCE: "cross",
@@ -40,6 +64,17 @@ ROLE_SYMBOLS = {
     VehicleRole.GENERAL_LOGISTICS: "diamond",
 }
 
+# Node type colours for locations
+NODE_TYPE_COLORS = {
+    "combat": "#FF4444",
+    "medical_role1": "#44FF44",
+    "medical_role2": "#00AA00",
+    "repair_workshop": "#FFAA00",
+    "ammo_point": "#FF8800",
+    "fuel_point": "#8888FF",
+    "hq": "#FFFF00",
+}
+
 # Priority colours for casualties
 PRIORITY_COLORS = {
     1: "#FF0000",  # Red - Urgent
@@ -48,6 +83,16 @@ PRIORITY_COLORS = {
     4: "#88FF88",  # Green - Convenience
 }
 
+# Colour tables indexed by state code and by priority value, so a frame's
+# colours are one array gather rather than a dict lookup per marker
+_STATE_COLOR_BY_CODE = np.array(
+    [STATE_COLORS.get(state, "#888888") for state in _VEHICLE_STATES], dtype=object
+)
+_PRIORITY_COLOR_BY_VALUE = np.array(
+    [PRIORITY_COLORS.get(p, "#FF8800") for p in range(max(PRIORITY_COLORS) + 1)],
+    dtype=object,
+)
+
 
 @dataclass
 class PlaybackState:
@@ -59,8 +104,8 @@ class PlaybackState:
     duration_mins: float = 480.0
     last_update_time: float = 0.0
 
-    # Cache of event times for jumping
-    event_times: list[float] = field(default_factory=list)
+    # Cache of sorted, unique event times for jumping
+    event_times: np.ndarray = field(default_factory=lambda: np.empty(0))
 
     def advance(self, real_delta_ms: float) -> None:
         """Advance simulation time based on real time elapsed."""
@@ -81,15 +126,45 @@ class PlaybackState:
 
     def jump_to_next_event(self) -> None:
         """Jump to next event after current time."""
-        future_events = [t for t in self.event_times if t > self.current_time_mins + 0.1]
-        if future_events:
-            self.current_time_mins = future_events[0]
+        i = np.searchsorted(self.event_times, self.current_time_mins + 0.1, side="right")
+        if i < len(self.event_times):
+            self.current_time_mins = float(self.event_times[i])
 
     def jump_to_prev_event(self) -> None:
         """Jump to previous event before current time."""
-        past_events = [t for t in self.event_times if t < self.current_time_mins - 0.1]
-        if past_events:
-            self.current_time_mins = past_events[-1]
+        i = np.searchsorted(self.event_times, self.current_time_mins - 0.1, side="left")
+        if i > 0:
+            self.current_time_mins = float(self.event_times[i - 1])
+
+
+# Replay refresh interval while playing (~30fps)
+FRAME_INTERVAL_SECS = 0.033
+
+# Session state keys for data derived from the current scenario and event log
+REPLAY_CACHE_KEYS = (
+    "replay_graph",
+    "replay_vehicle_index",
+    "replay_figure",
+    "replay_figure_time",
+    "replay_node_positions",
+    "replay_transit_segments",
+    "replay_casualty_intervals",
+    "replay_event_times",
+)
+
+
+def _session_cached(key: str, build: Callable[[], T]) -> T:
+    """Return ``st.session_state[key]``, building it on first use."""
+    if key not in st.session_state:
+        st.session_state[key] = build()
+    return st.session_state[key]
+
+
+def clear_replay_cache() -> None:
+    """Drop cached replay data, e.g. after a new simulation run."""
+    for key in REPLAY_CACHE_KEYS:
+        if key in st.session_state:
+            del st.session_state[key]
 
 
 def get_playback_state() -> PlaybackState:
@@ -99,16 +174,22 @@ def get_playback_state() -> PlaybackState:
     return st.session_state.playback_state
 
 
-def build_event_times(event_log) -> list[float]:
-    """Extract unique event times from log for jumping."""
-    times = set()
-    for event in event_log.events:
-        times.add(event.time_mins)
-    return sorted(times)
+def build_event_times(event_log) -> np.ndarray:
+    """Extract sorted, unique event times from log for jumping."""
+    events = event_log.events
+    return np.unique(
+        np.fromiter((e.time_mins for e in events), dtype=np.float64, count=len(events))
+    )
+
 
+def build_network_graph(scenario_data: dict) -> "nx.Graph":
+    """Build NetworkX graph from scenario data.
+
+    NetworkX is imported here so that loading the app does not pay for it
+    until the replay tab has results to show.
+    """
+    import networkx as nx
 
-def build_network_graph(scenario_data: dict) -> nx.Graph:
-    """Build NetworkX graph from scenario data."""
     G = nx.Graph()
 
     # Add nodes
@@ -134,149 +215,257 @@ def build_network_graph(scenario_data: dict) -> nx.Graph:
     return G
 
 
+def build_vehicle_event_index(event_log) -> dict[str, tuple[np.ndarray, list]]:
+    """Group events by entity as (times, events), both in time order.
+
+    Built once per event log so each frame can binary-search one
+    vehicle's events instead of scanning the whole log.
+    """
+    grouped: dict[str, list] = {}
+    for event in event_log.events:
+        grouped.setdefault(event.entity_id, []).append(event)
+
+    return {
+        entity_id: (
+            np.fromiter((e.time_mins for e in events), dtype=np.float64, count=len(events)),
+            events,
+        )
+        for entity_id, events in grouped.items()
+    }
+
+
 def get_vehicle_state_at_time(
     vehicle_id: str,
     current_time: float,
-    event_log,
+    vehicle_index: dict[str, tuple[np.ndarray, list]],
 ) -> tuple[Optional[str], VehicleState]:
     """Get vehicle location and state at given time."""
     location = None
     state = VehicleState.IDLE
 
-    # Find most recent events for this vehicle
-    vehicle_events = [
-        e for e in event_log.events
-        if e.entity_id == vehicle_id and e.time_mins <= current_time
-    ]
-    vehicle_events.sort(key=lambda e: e.time_mins)
+    if vehicle_id not in vehicle_index:
+        return location, state
 
-    for event in vehicle_events:
+    # Events up to and including current_time
+    times, events = vehicle_index[vehicle_id]
+    end = int(np.searchsorted(times, current_time, side="right"))
+
+    for event in events[:end]:
         if event.location:
             location = event.location
-
-        # Update state based on event type
-        if event.event_type == EventType.VEHICLE_DISPATCHED:
-            state = VehicleState.TRANSITING_UNLADEN
-        elif event.event_type == EventType.VEHICLE_ARRIVED:
-            state = VehicleState.IDLE
-        elif event.event_type == EventType.LOADING_STARTED:
-            state = VehicleState.LOADING
-        elif event.event_type == EventType.LOADING_COMPLETED:
-            state = VehicleState.TRANSITING_LADEN
-        elif event.event_type == EventType.UNLOADING_STARTED:
-            state = VehicleState.UNLOADING
-        elif event.event_type == EventType.UNLOADING_COMPLETED:
-            state = VehicleState.IDLE
-        elif event.event_type == EventType.VEHICLE_RETURNED:
-            state = VehicleState.IDLE
-        elif event.event_type == EventType.HOOKUP_STARTED:
-            state = VehicleState.HOOKUP
-        elif event.event_type == EventType.HOOKUP_COMPLETED:
-            state = VehicleState.TRANSITING_LADEN
-        elif event.event_type == EventType.CREW_REST_STARTED:
-            state = VehicleState.CREW_REST
-        elif event.event_type == EventType.CREW_REST_ENDED:
-            state = VehicleState.IDLE
+        state = _EVENT_TO_STATE.get(event.event_type, state)
 
     return location, state
 
 
-def get_vehicle_position_at_time(
-    vehicle_id: str,
-    current_time: float,
-    event_log,
-    graph: nx.Graph,
-) -> tuple[float, float]:
-    """Calculate interpolated vehicle position at given time."""
-    # Get events for this vehicle
-    vehicle_events = [
-        e for e in event_log.events
-        if e.entity_id == vehicle_id
-    ]
-    vehicle_events.sort(key=lambda e: e.time_mins)
+def build_node_positions(graph: "nx.Graph") -> tuple[dict[str, int], np.ndarray]:
+    """Map node IDs to rows of an (N, 2) float32 array of node coordinates.
+
+    Single precision is ample for km-scale map positions.
+    """
+    node_index = {node_id: i for i, node_id in enumerate(graph.nodes)}
+    node_xy = np.array(
+        [(data["x"], data["y"]) for _, data in graph.nodes(data=True)],
+        dtype=np.float32,
+    ).reshape(-1, 2)
+    return node_index, node_xy
 
-    # Find the bracketing events
-    last_location = None
-    last_time = 0.0
-    next_location = None
-    next_time = None
 
-    for event in vehicle_events:
-        if event.time_mins <= current_time:
+@dataclass
+class TransitSegments:
+    """Per-vehicle movement state after each event, stacked into flat arrays.
+
+    Vehicle ``i`` owns rows ``offsets[i]`` to ``offsets[i] + len(times[i])``;
+    the row ``offsets[i] + k`` describes the vehicle once its first ``k``
+    events have happened. ``src`` is the node row of the last known
+    location (-1 if unknown or off the map), ``dst`` the node row of the
+    dispatch destination (-1 if none, -2 if off the map), and ``t0``/``t1``
+    the times the vehicle was last seen at ``src`` and is due at ``dst``.
+    ``state`` indexes ``_VEHICLE_STATES``. Times stay float64 so event
+    boundaries compare exactly against the playback clock.
+    """
+
+    times: list[np.ndarray]
+    offsets: np.ndarray
+    t0: np.ndarray
+    t1: np.ndarray
+    src: np.ndarray
+    dst: np.ndarray
+    state: np.ndarray
+
+    def _rows_at(self, current_time: float) -> np.ndarray:
+        """Row of every vehicle once its events up to ``current_time`` happened."""
+        return self.offsets + np.fromiter(
+            (np.searchsorted(times, current_time, side="right") for times in self.times),
+            dtype=np.intp,
+            count=len(self.times),
+        )
+
+    def state_codes_at(self, current_time: float) -> np.ndarray:
+        """State code (index into ``_VEHICLE_STATES``) of every vehicle."""
+        return self.state[self._rows_at(current_time)]
+
+    def states_at(self, current_time: float) -> list[VehicleState]:
+        """State of every vehicle at ``current_time``."""
+        return [_VEHICLE_STATES[code] for code in self.state_codes_at(current_time)]
+
+    def positions_at(self, current_time: float, node_xy: np.ndarray) -> np.ndarray:
+        """Interpolated (x, y) of every vehicle at ``current_time``."""
+        rows = self._rows_at(current_time)
+        t0 = self.t0[rows]
+        t1 = self.t1[rows]
+        src = self.src[rows]
+        dst = self.dst[rows]
+
+        # Unknown or off-map locations are drawn at the origin
+        positions = np.zeros((len(rows), 2), dtype=node_xy.dtype)
+
+        # In transit until the arrival time; NaN (no arrival) compares False
+        known = src >= 0
+        moving = known & (dst != -1) & (current_time < t1)
+        parked = known & ~moving
+        positions[parked] = node_xy[src[parked]]
+
+        interp = moving & (dst >= 0)
+        progress = ((current_time - t0[interp]) / (t1[interp] - t0[interp])).astype(node_xy.dtype)
+        start = node_xy[src[interp]]
+        end = node_xy[dst[interp]]
+        positions[interp] = start + (end - start) * progress[:, None]
+
+        return positions
+
+
+def build_transit_segments(
+    vehicle_ids: list[str],
+    vehicle_index: dict[str, tuple[np.ndarray, list]],
+    node_index: dict[str, int],
+) -> TransitSegments:
+    """Precompute each vehicle's movement state after each of its events."""
+    empty = (np.empty(0), [])
+    times_list = []
+    t0_parts = []
+    t1_parts = []
+    src_parts = []
+    dst_parts = []
+    state_parts = []
+
+    for vehicle_id in vehicle_ids:
+        times, events = vehicle_index.get(vehicle_id, empty)
+        is_arrival = np.fromiter(
+            (e.event_type == EventType.VEHICLE_ARRIVED for e in events),
+            dtype=bool,
+            count=len(events),
+        )
+        arrivals = times[is_arrival]
+
+        # Row 0 is the state before the vehicle's first event
+        last_src, last_time, next_dst, next_time = -1, 0.0, -1, np.nan
+        current_state = VehicleState.IDLE
+        src = [last_src]
+        t0 = [last_time]
+        dst = [next_dst]
+        t1 = [next_time]
+        state = [_STATE_CODES[current_state]]
+
+        for event in events:
             if event.location:
-                last_location = event.location
+                last_src = node_index.get(event.location, -1)
                 last_time = event.time_mins
 
-            # Check for departure to destination
+            # Departure to destination, due at the next arrival
             if event.event_type == EventType.VEHICLE_DISPATCHED:
                 dest = event.details.get("destination")
                 if dest:
-                    next_location = dest
-                    # Find arrival time
-                    for future_event in vehicle_events:
-                        if (future_event.time_mins > event.time_mins and
-                            future_event.event_type == EventType.VEHICLE_ARRIVED):
-                            next_time = future_event.time_mins
-                            break
-        else:
-            break
-
-    # If not in transit, return last known location
-    if (next_location is None or next_time is None or
-        current_time >= next_time or last_location is None):
-        if last_location and last_location in graph.nodes:
-            node = graph.nodes[last_location]
-            return (node["x"], node["y"])
-        return (0, 0)
-
-    # Interpolate position
-    progress = (current_time - last_time) / (next_time - last_time) if next_time > last_time else 0
-
-    if last_location in graph.nodes and next_location in graph.nodes:
-        start = graph.nodes[last_location]
-        end = graph.nodes[next_location]
-        return (
-            start["x"] + (end["x"] - start["x"]) * progress,
-            start["y"] + (end["y"] - start["y"]) * progress,
-        )
+                    next_dst = node_index.get(dest, -2)
+                    i = np.searchsorted(arrivals, event.time_mins, side="right")
+                    if i < len(arrivals):
+                        next_time = arrivals[i]
+
+            current_state = _EVENT_TO_STATE.get(event.event_type, current_state)
+
+            src.append(last_src)
+            t0.append(last_time)
+            dst.append(next_dst)
+            t1.append(next_time)
+            state.append(_STATE_CODES[current_state])
+
+        times_list.append(times)
+        t0_parts.append(np.array(t0, dtype=np.float64))
+        t1_parts.append(np.array(t1, dtype=np.float64))
+        src_parts.append(np.array(src, dtype=np.intp))
+        dst_parts.append(np.array(dst, dtype=np.intp))
+        state_parts.append(np.array(state, dtype=np.uint8))
+
+    offsets = np.cumsum([0, *(len(t0) for t0 in t0_parts)], dtype=np.intp)[:-1]
+
+    def stack(parts, dtype):
+        return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+    return TransitSegments(
+        times=times_list,
+        offsets=offsets,
+        t0=stack(t0_parts, np.float64),
+        t1=stack(t1_parts, np.float64),
+        src=stack(src_parts, np.intp),
+        dst=stack(dst_parts, np.intp),
+        state=stack(state_parts, np.uint8),
+    )
 
-    return (0, 0)
 
+@dataclass
+class CasualtyIntervals:
+    """When each casualty waits for collection, as parallel arrays.
+
+    ``collected`` is infinite for casualties never collected; ``row`` is
+    the node row of the casualty's origin, or -1 if it is off the map.
+    """
+
+    ids: list[str]
+    priority: np.ndarray
+    row: np.ndarray
+    generated: np.ndarray
+    collected: np.ndarray
+
+    def active_at(self, current_time: float) -> np.ndarray:
+        """Indices of on-map casualties waiting for collection at ``current_time``."""
+        return np.flatnonzero(
+            (self.generated <= current_time)
+            & (self.collected > current_time)
+            & (self.row >= 0)
+        )
 
-def get_active_casualties(
-    current_time: float,
-    event_log,
-) -> list[dict]:
-    """Get casualties that are waiting for collection at current time."""
-    active = []
 
-    for casualty in event_log.casualties:
-        # Casualty exists if generated before current time
-        if casualty.time_generated > current_time:
-            continue
+def build_casualty_intervals(event_log, node_index: dict[str, int]) -> CasualtyIntervals:
+    """Precompute casualty waiting intervals for per-frame masking."""
+    casualties = event_log.casualties
+    count = len(casualties)
+    return CasualtyIntervals(
+        ids=[c.id for c in casualties],
+        priority=np.fromiter((c.priority for c in casualties), dtype=np.int8, count=count),
+        row=np.fromiter(
+            (node_index.get(c.origin_node, -1) for c in casualties),
+            dtype=np.intp,
+            count=count,
+        ),
+        generated=np.fromiter(
+            (c.time_generated for c in casualties), dtype=np.float64, count=count
+        ),
+        collected=np.fromiter(
+            (np.inf if c.time_collected is None else c.time_collected for c in casualties),
+            dtype=np.float64,
+            count=count,
+        ),
+    )
 
-        # Casualty is active if not yet collected
-        if casualty.time_collected is None or casualty.time_collected > current_time:
-            active.append({
-                "id": casualty.id,
-                "location": casualty.origin_node,
-                "priority": casualty.priority,
-                "time_generated": casualty.time_generated,
-            })
 
-    return active
+def build_static_traces(scenario_data: dict, graph: "nx.Graph") -> tuple[go.Scatter, ...]:
+    """Build the edge and node traces, which do not change during playback."""
+    traces = []
 
+    # Draw edges as one trace, with None breaking the line between edges
+    edge_x = []
+    edge_y = []
 
-def render_animated_map(
-    current_time: float,
-    scenario_data: dict,
-    event_log,
-    graph: nx.Graph,
-) -> go.Figure:
-    """Render the map at the given time."""
-    fig = go.Figure()
-
-    # Draw edges
     for edge in scenario_data.get("edges", []):
         from_node = edge.get("from") or edge.get("from_node")
         to_node = edge.get("to") or edge.get("to_node")
@@ -284,15 +473,17 @@ def render_animated_map(
         if from_node in graph.nodes and to_node in graph.nodes:
             n1 = graph.nodes[from_node]
             n2 = graph.nodes[to_node]
-
-            fig.add_trace(go.Scatter(
-                x=[n1["x"], n2["x"]],
-                y=[n1["y"], n2["y"]],
-                mode="lines",
-                line=dict(color="#CCCCCC", width=2),
-                hoverinfo="skip",
-                showlegend=False,
-            ))
+            edge_x.extend((n1["x"], n2["x"], None))
+            edge_y.extend((n1["y"], n2["y"], None))
+
+    traces.append(go.Scatter(
+        x=edge_x,
+        y=edge_y,
+        mode="lines",
+        line=dict(color="#CCCCCC", width=2),
+        hoverinfo="skip",
+        showlegend=False,
+    ))
 
     # Draw nodes
     node_x = []
@@ -300,23 +491,13 @@ def render_animated_map(
     node_text = []
     node_colors = []
 
-    NODE_TYPE_COLORS = {
-        "combat": "#FF4444",
-        "medical_role1": "#44FF44",
-        "medical_role2": "#00AA00",
-        "repair_workshop": "#FFAA00",
-        "ammo_point": "#FF8800",
-        "fuel_point": "#8888FF",
-        "hq": "#FFFF00",
-    }
-
     for node_id, node_data in graph.nodes(data=True):
         node_x.append(node_data["x"])
         node_y.append(node_data["y"])
         node_text.append(node_data.get("name", node_id))
         node_colors.append(NODE_TYPE_COLORS.get(node_data.get("node_type"), "#888888"))
 
-    fig.add_trace(go.Scatter(
+    traces.append(go.Scatter(
         x=node_x,
         y=node_y,
         mode="markers+text",
@@ -328,40 +509,44 @@ def render_animated_map(
         showlegend=False,
     ))
 
-    # Draw active casualties
-    active_casualties = get_active_casualties(current_time, event_log)
-    for cas in active_casualties:
-        if cas["location"] in graph.nodes:
-            node = graph.nodes[cas["location"]]
-            color = PRIORITY_COLORS.get(cas["priority"], "#FF8800")
-
-            # Offset slightly to not overlap with node
-            offset_x = 1.5
-            offset_y = -1.5
-
-            fig.add_trace(go.Scatter(
-                x=[node["x"] + offset_x],
-                y=[node["y"] + offset_y],
-                mode="markers",
-                marker=dict(
-                    size=12,
-                    color=color,
-                    symbol="x",
-                    line=dict(width=2, color="white"),
-                ),
-                hovertext=f"Casualty P{cas['priority']}<br>{cas['id']}",
-                hoverinfo="text",
-                showlegend=False,
-            ))
-
-    # Draw vehicles
+    return tuple(traces)
+
+
+def build_replay_figure(
+    scenario_data: dict,
+    static_traces: tuple[go.Scatter, ...],
+) -> go.Figure:
+    """Build the replay map, ending with empty casualty and vehicle traces.
+
+    Those last two traces are updated in place for each frame by
+    render_animated_map; everything else stays as built here.
+    """
+    fig = go.Figure(data=list(static_traces))
+
+    # Active casualties
+    fig.add_trace(go.Scatter(
+        x=[],
+        y=[],
+        mode="markers",
+        marker=dict(
+            size=12,
+            symbol="x",
+            line=dict(width=2, color="white"),
+        ),
+        hoverinfo="text",
+        showlegend=False,
+    ))
+
+    # Vehicles; role symbols and callsigns do not change during playback
     vehicles = scenario_data.get("vehicles", [])
     vehicle_types = {vt["id"]: vt for vt in scenario_data.get("vehicle_types", [])}
 
+    veh_roles = []
+    veh_callsigns = []
+
     for vehicle in vehicles:
         vehicle_id = vehicle["id"]
         type_id = vehicle.get("type_id", "")
-        callsign = vehicle.get("callsign", vehicle_id)
 
         # Get vehicle type info
         vtype = vehicle_types.get(type_id, {})
@@ -371,30 +556,24 @@ def render_animated_map(
         except ValueError:
             role = VehicleRole.GENERAL_LOGISTICS
 
-        # Get position and state
-        x, y = get_vehicle_position_at_time(vehicle_id, current_time, event_log, graph)
-        _, state = get_vehicle_state_at_time(vehicle_id, current_time, event_log)
-
-        color = STATE_COLORS.get(state, "#888888")
-        symbol = ROLE_SYMBOLS.get(role, "circle")
-
-        fig.add_trace(go.Scatter(
-            x=[x],
-            y=[y],
-            mode="markers+text",
-            marker=dict(
-                size=15,
-                color=color,
-                symbol=symbol,
-                line=dict(width=2, color="white"),
-            ),
-            text=[callsign],
-            textposition="bottom center",
-            textfont=dict(size=9),
-            hovertext=f"<b>{callsign}</b><br>State: {state.value}",
-            hoverinfo="text",
-            showlegend=False,
-        ))
+        veh_roles.append(role)
+        veh_callsigns.append(vehicle.get("callsign", vehicle_id))
+
+    fig.add_trace(go.Scatter(
+        x=[],
+        y=[],
+        mode="markers+text",
+        marker=dict(
+            size=15,
+            symbol=[ROLE_SYMBOLS.get(role, "circle") for role in veh_roles],
+            line=dict(width=2, color="white"),
+        ),
+        text=veh_callsigns,
+        textposition="bottom center",
+        textfont=dict(size=9),
+        hoverinfo="text",
+        showlegend=False,
+    ))
 
     # Update layout
     fig.update_layout(
@@ -418,11 +597,57 @@ def render_animated_map(
     return fig
 
 
+def render_animated_map(
+    fig: go.Figure,
+    current_time: float,
+    transit_segments: TransitSegments,
+    casualty_intervals: CasualtyIntervals,
+    node_xy: np.ndarray,
+) -> go.Figure:
+    """Update a figure from build_replay_figure to the given time."""
+    casualty_trace, vehicle_trace = fig.data[-2:]
+
+    # Active casualties, offset slightly to not overlap with node
+    offset_x = 1.5
+    offset_y = -1.5
+
+    active = casualty_intervals.active_at(current_time)
+    cas_xy = node_xy[casualty_intervals.row[active]]
+    cas_priorities = casualty_intervals.priority[active]
+
+    # Vehicle positions and states
+    positions = transit_segments.positions_at(current_time, node_xy)
+    state_codes = transit_segments.state_codes_at(current_time)
+
+    with fig.batch_update():
+        casualty_trace.update(
+            x=cas_xy[:, 0] + offset_x,
+            y=cas_xy[:, 1] + offset_y,
+            marker_color=_PRIORITY_COLOR_BY_VALUE[cas_priorities],
+            hovertext=[
+                f"Casualty P{p}<br>{casualty_intervals.ids[i]}"
+                for i, p in zip(active, cas_priorities.tolist())
+            ],
+        )
+        vehicle_trace.update(
+            x=positions[:, 0],
+            y=positions[:, 1],
+            marker_color=_STATE_COLOR_BY_CODE[state_codes],
+            hovertext=[
+                f"<b>{callsign}</b><br>State: {_VEHICLE_STATES[code].value}"
+                for callsign, code in zip(vehicle_trace.text, state_codes)
+            ],
+        )
+
+    return fig
+
+
 def render_events_at_time(current_time: float, event_log) -> None:
     """Render events occurring at or near the current time."""
-    # Find events within +/- 1 minute
+    # Find events within +/- 1 minute; filter_by_time binary-searches the
+    # log's time column and includes both ends, so trim those
     nearby_events = [
-        e for e in event_log.events
+        e for e in event_log.filter_by_time(current_time - 1.0, current_time + 1.0)
         if abs(e.time_mins - current_time) < 1.0
     ]
 
@@ -434,59 +659,30 @@ def render_events_at_time(current_time: float, event_log) -> None:
         st.caption("No events at this time")
 
 
-def render_replay_tab() -> None:
-    """Render the full replay tab with playback controls and animated map."""
-    st.header("Simulation Replay")
-    st.markdown("Watch an animated timeline of your simulation. See how vehicles respond to events and move across the network.")
-
-    if "scenario_data" not in st.session_state:
-        st.warning("No scenario loaded. Please load or build a scenario first.")
-        return
-
-    if "event_log" not in st.session_state:
-        st.warning("No simulation results. Please run a simulation first to watch the replay.")
-        st.info("Go to the **Run Simulation** tab and click 'Run Simulation' to generate results.")
-        return
-
-    with st.expander("How to use the replay", expanded=False):
-        st.markdown("""
-        **Controls:**
-        - **Play/Pause** - Start or stop the animation
-        - **Speed** - Adjust how fast time passes (1x = real-time, 10x = 10 minutes per second)
-        - **Prev/Next** - Jump to the previous or next event
-        - **Slider** - Drag to any point in time
-
-        **What you're seeing:**
-        - **Colored circles** = Locations (color indicates type)
-        - **Moving symbols** = Vehicles (cross = ambulance, square = recovery, diamond = logistics)
-        - **X markers** = Active casualties waiting for pickup (color indicates priority)
-
-        **Vehicle colors show status:**
-        - Green = Idle, ready for tasking
-        - Blue = Moving/in transit
-        - Amber = Loading or unloading
-        - Red = Broken down
-        - Grey = Crew resting
-        """)
-
-    scenario_data = st.session_state["scenario_data"]
-    event_log = st.session_state["event_log"]
-
-    # Initialize playback state
-    playback = get_playback_state()
-
-    # Build graph and event times if needed
-    if "replay_graph" not in st.session_state:
-        st.session_state.replay_graph = build_network_graph(scenario_data)
-
-    graph = st.session_state.replay_graph
+def _render_playback_panel(
+    playback: PlaybackState,
+    event_log,
+    replay_figure: go.Figure,
+    transit_segments: TransitSegments,
+    casualty_intervals: CasualtyIntervals,
+    node_xy: np.ndarray,
+) -> None:
+    """Render playback controls, scrubber, map and events for one frame.
+
+    Run as a fragment that ticks every FRAME_INTERVAL_SECS while playing.
+    Play, pause, reset and reaching the end rerun the full app so the
+    fragment's refresh interval is switched on or off.
+    """
+    # === Auto-advance ===
+    if playback.is_playing:
+        current_time = time.time()
+        delta_ms = (current_time - playback.last_update_time) * 1000
+        playback.last_update_time = current_time
 
-    if not playback.event_times:
-        playback.event_times = build_event_times(event_log)
+        playback.advance(delta_ms)
 
-    # Set duration from scenario
-    duration_hours = scenario_data.get("config", {}).get("duration_hours", 8)
-    playback.duration_mins = float(duration_hours) * 60.0
+        if not playback.is_playing:
+            st.rerun()
 
     # === Control Bar ===
     st.subheader("Playback Controls")
@@ -501,7 +697,6 @@ def render_replay_tab() -> None:
     with col2:
         if st.button("Prev", help="Jump to the previous event"):
             playback.jump_to_prev_event()
-            st.rerun()
 
     with col3:
         if playback.is_playing:
@@ -517,7 +712,6 @@ def render_replay_tab() -> None:
     with col4:
         if st.button("Next", help="Jump to the next event"):
             playback.jump_to_next_event()
-            st.rerun()
 
     with col5:
         speed_options = [0.5, 1.0, 2.0, 5.0, 10.0]
@@ -551,22 +745,117 @@ def render_replay_tab() -> None:
     )
 
     if abs(new_time - playback.current_time_mins) > 0.5:
+        was_playing = playback.is_playing
         playback.current_time_mins = new_time
         playback.is_playing = False
+        if was_playing:
+            st.rerun()
 
     # === Map ===
-    fig = render_animated_map(
-        playback.current_time_mins,
-        scenario_data,
-        event_log,
-        graph,
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    # Only update the traces when the time has moved, e.g. not when paused
+    if st.session_state.get("replay_figure_time") != playback.current_time_mins:
+        render_animated_map(
+            replay_figure,
+            playback.current_time_mins,
+            transit_segments,
+            casualty_intervals,
+            node_xy,
+        )
+        st.session_state.replay_figure_time = playback.current_time_mins
+    st.plotly_chart(replay_figure, use_container_width=True, key="replay_map")
 
     # === Events Panel ===
     st.subheader("Activity Log")
     render_events_at_time(playback.current_time_mins, event_log)
 
+
+def render_replay_tab() -> None:
+    """Render the full replay tab with playback controls and animated map."""
+    st.header("Simulation Replay")
+    st.markdown("Watch an animated timeline of your simulation. See how vehicles respond to events and move across the network.")
+
+    if "scenario_data" not in st.session_state:
+        st.warning("No scenario loaded. Please load or build a scenario first.")
+        return
+
+    if "event_log" not in st.session_state:
+        st.warning("No simulation results. Please run a simulation first to watch the replay.")
+        st.info("Go to the **Run Simulation** tab and click 'Run Simulation' to generate results.")
+        return
+
+    with st.expander("How to use the replay", expanded=False):
+        st.markdown("""
+        **Controls:**
+        - **Play/Pause** - Start or stop the animation
+        - **Speed** - Adjust how fast time passes (1x = real-time, 10x = 10 minutes per second)
+        - **Prev/Next** - Jump to the previous or next event
+        - **Slider** - Drag to any point in time
+
+        **What you're seeing:**
+        - **Colored circles** = Locations (color indicates type)
+        - **Moving symbols** = Vehicles (cross = ambulance, square = recovery, diamond = logistics)
+        - **X markers** = Active casualties waiting for pickup (color indicates priority)
+
+        **Vehicle colors show status:**
+        - Green = Idle, ready for tasking
+        - Blue = Moving/in transit
+        - Amber = Loading or unloading
+        - Red = Broken down
+        - Grey = Crew resting
+        """)
+
+    scenario_data = st.session_state["scenario_data"]
+    event_log = st.session_state["event_log"]
+
+    # Initialize playback state
+    playback = get_playback_state()
+
+    # Build graph, vehicle event index and event times if needed
+    graph = _session_cached("replay_graph", lambda: build_network_graph(scenario_data))
+    vehicle_index = _session_cached(
+        "replay_vehicle_index", lambda: build_vehicle_event_index(event_log)
+    )
+    replay_figure = _session_cached(
+        "replay_figure",
+        lambda: build_replay_figure(scenario_data, build_static_traces(scenario_data, graph)),
+    )
+    node_index, node_xy = _session_cached(
+        "replay_node_positions", lambda: build_node_positions(graph)
+    )
+    transit_segments = _session_cached(
+        "replay_transit_segments",
+        lambda: build_transit_segments(
+            [v["id"] for v in scenario_data.get("vehicles", [])],
+            vehicle_index,
+            node_index,
+        ),
+    )
+    casualty_intervals = _session_cached(
+        "replay_casualty_intervals", lambda: build_casualty_intervals(event_log, node_index)
+    )
+    playback.event_times = _session_cached(
+        "replay_event_times", lambda: build_event_times(event_log)
+    )
+
+    # Set duration from scenario
+    duration_hours = scenario_data.get("config", {}).get("duration_hours", 8)
+    playback.duration_mins = float(duration_hours) * 60.0
+
+    # Controls, scrubber, map and events rerun on their own while playing,
+    # rather than rerunning the whole app every frame
+    playback_panel = st.fragment(
+        _render_playback_panel,
+        run_every=FRAME_INTERVAL_SECS if playback.is_playing else None,
+    )
+    playback_panel(
+        playback,
+        event_log,
+        replay_figure,
+        transit_segments,
+        casualty_intervals,
+        node_xy,
+    )
+
     # === Legend ===
     with st.expander("Map Legend & Symbol Guide"):
         col1, col2 = st.columns(2)
@@ -589,15 +878,3 @@ def render_replay_tab() -> None:
             st.markdown("- **+** Cross: Ambulance")
             st.markdown("- **Square**: Recovery vehicle")
             st.markdown("- **Diamond**: Logistics vehicle")
-
-    # === Auto-advance ===
-    if playback.is_playing:
-        current_time = time.time()
-        delta_ms = (current_time - playback.last_update_time) * 1000
-        playback.last_update_time = current_time
-
-        playback.advance(delta_ms)
-
-        # Refresh at ~30fps
-        time.sleep(0.033)
-        st.rerun()
@@ -74,7 +74,7 @@ def render_vehicle_builder() -> None:
             selected_type = st.selectbox(
                 "Vehicle Type",
                 options=type_options,
-                format_func=lambda x: VEHICLE_TYPE_LIBRARY[x]["name"],
+                format_func=lambda x: VEHICLE_TYPE_LIBRARY[x].name,
                 key="new_vehicle_type",
                 help="Different vehicle types have different speeds, capacities, and capabilities",
             )
@@ -90,7 +90,7 @@ def render_vehicle_builder() -> None:
 
         # Auto-generate callsign
         if selected_type:
-            role = VehicleRole(VEHICLE_TYPE_LIBRARY[selected_type]["role"])
+            role = VEHICLE_TYPE_LIBRARY[selected_type].role
             existing_callsigns = [v.callsign for v in canvas_state.vehicles]
             suggested_callsign = generate_callsign(role, existing_callsigns)
 
@@ -134,7 +134,7 @@ def render_vehicle_builder() -> None:
                 if role in VEHICLE_TYPES_BY_ROLE:
                     type_id = VEHICLE_TYPES_BY_ROLE[role][0]
                     if st.button(
-                        f"+ Add {VEHICLE_TYPE_LIBRARY[type_id]['name']}",
+                        f"+ Add {VEHICLE_TYPE_LIBRARY[type_id].name}",
                         key=f"quick_add_{role.value}",
                     ):
                         existing_callsigns = [v.callsign for v in canvas_state.vehicles]
@@ -150,8 +150,8 @@ def render_vehicle_builder() -> None:
                         st.rerun()
             else:
                 for vehicle in role_vehicles:
-                    type_info = VEHICLE_TYPE_LIBRARY.get(vehicle.type_id, {})
-                    type_name = type_info.get("name", vehicle.type_id)
+                    type_info = VEHICLE_TYPE_LIBRARY.get(vehicle.type_id)
+                    type_name = type_info.name if type_info else vehicle.type_id
 
                     col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
 
@@ -6,14 +6,11 @@ Manages the synchronisation between:
 - Streamlit session state (persistence across reruns)
 """
 
+import re
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
-import streamlit as st
-from streamlit_flow import StreamlitFlowState
-from streamlit_flow.elements import StreamlitFlowNode, StreamlitFlowEdge
-
 from pj_ogun.models.enums import (
     NodeType,
     VehicleRole,
@@ -24,6 +21,10 @@ from pj_ogun.models.enums import (
 )
 from pj_ogun.models.vehicles import VEHICLE_TYPE_LIBRARY
 
+if TYPE_CHECKING:
+    from streamlit_flow import StreamlitFlowState
+    from streamlit_flow.elements import StreamlitFlowNode, StreamlitFlowEdge
+
 
 # Visual configuration for node types
 NODE_CONFIG = {
@@ -96,8 +97,27 @@ NODE_ICONS = {
     NodeType.FORWARD_ARMING: "FARP",
 }
 
+# Per-type lookups as tuples indexed by NodeType declaration order
+_NODE_TYPE_INDEX = {nt: i for i, nt in enumerate(NodeType)}
+_NODE_CONFIG_ARR = tuple(NODE_CONFIG[nt] for nt in NodeType)
+_NODE_ICONS_ARR = tuple(NODE_ICONS[nt] for nt in NodeType)
+
+# Flow node styles are fixed per type, so build them once
+_NODE_STYLE_ARR = tuple(
+    {
+        "backgroundColor": config["color"],
+        "color": "white" if config["color"] not in ["#FFFF00", "#44FF44", "#FFAA00"] else "black",
+        "padding": "10px",
+        "borderRadius": "8px",
+        "border": "2px solid #333",
+        "minWidth": "100px",
+        "textAlign": "center",
+    }
+    for config in _NODE_CONFIG_ARR
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class NodeData:
     """Extended data stored with each node."""
 
@@ -119,7 +139,7 @@ class NodeData:
     resupply_interval_hours: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleEntry:
     """A vehicle in the fleet."""
 
@@ -132,11 +152,11 @@ class VehicleEntry:
     def role(self) -> VehicleRole:
         """Get the role from the type library."""
         if self.type_id in VEHICLE_TYPE_LIBRARY:
-            return VehicleRole(VEHICLE_TYPE_LIBRARY[self.type_id]["role"])
+            return VEHICLE_TYPE_LIBRARY[self.type_id].role
         return VehicleRole.GENERAL_LOGISTICS
 
 
-@dataclass
+@dataclass(slots=True)
 class ManualEvent:
     """A manual demand event."""
 
@@ -148,7 +168,7 @@ class ManualEvent:
     priority: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class RateConfig:
     """Rate-based demand configuration."""
 
@@ -161,15 +181,16 @@ class RateConfig:
     priority_p3: float = 0.6
 
 
-@dataclass
+@dataclass(slots=True)
 class CanvasState:
     """Complete state for the scenario builder canvas."""
 
     # Flow state (nodes and edges)
-    flow_state: Optional[StreamlitFlowState] = None
+    flow_state: Optional["StreamlitFlowState"] = None
 
-    # Node extended data (keyed by node id)
-    node_data: dict[str, NodeData] = field(default_factory=dict)
+    # Node extended data, stored densely with an id -> index map
+    node_data_list: list[NodeData] = field(default_factory=list)
+    _node_index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
 
     # Vehicles
     vehicles: list[VehicleEntry] = field(default_factory=list)
@@ -192,9 +213,97 @@ class CanvasState:
     selected_node_id: Optional[str] = None
     node_type_to_add: Optional[NodeType] = None
 
+    # Last number handed out per node type for new node ids
+    node_type_counters: dict[NodeType, int] = field(default_factory=dict)
+
+    # Route distances (km) by edge id; flow edge labels only display them
+    edge_distances: dict[str, float] = field(default_factory=dict)
+
+    def get_node_data(self, node_id: str) -> Optional[NodeData]:
+        """Look up extended data for a node (None if not present)."""
+        idx = self._node_index.get(node_id)
+        return None if idx is None else self.node_data_list[idx]
+
+    def set_node_data(self, data: NodeData) -> None:
+        """Add or replace the extended data for ``data.id``."""
+        idx = self._node_index.get(data.id)
+        if idx is None:
+            self._node_index[data.id] = len(self.node_data_list)
+            self.node_data_list.append(data)
+        else:
+            self.node_data_list[idx] = data
+
+    def remove_node_data(self, node_id: str) -> None:
+        """Remove extended data for a node, if present."""
+        idx = self._node_index.pop(node_id, None)
+        if idx is None:
+            return
+        # Swap the last entry into the freed slot to keep the list dense
+        last = self.node_data_list.pop()
+        if idx < len(self.node_data_list):
+            self.node_data_list[idx] = last
+            self._node_index[last.id] = idx
+
+    def next_node_number(self, node_type: NodeType) -> int:
+        """Return the next free number for a new ``{type}_{n}`` node id.
+
+        Counts up from the last number issued for the type, skipping ids
+        already in use (e.g. by nodes loaded from a scenario file).
+        """
+        counter = self.node_type_counters.get(node_type, 0) + 1
+        while f"{node_type.value}_{counter}" in self._node_index:
+            counter += 1
+        self.node_type_counters[node_type] = counter
+        return counter
+
+    def get_edge_distance(self, edge: "StreamlitFlowEdge", default: float = 5.0) -> float:
+        """Distance for a flow edge in km.
+
+        streamlit_flow rebuilds edges from their dict form on every rerun,
+        keeping only the label, so the number is held here by edge id. An
+        edge seen for the first time (e.g. loaded from a scenario) has its
+        label parsed once; ``default`` is returned, but not stored, when
+        the label holds no distance.
+        """
+        distance = self.edge_distances.get(edge.id)
+        if distance is None:
+            distance = _parse_distance_label(edge.label)
+            if distance is None:
+                return default
+            self.edge_distances[edge.id] = distance
+        return distance
+
+    def set_edge_distance(self, edge: "StreamlitFlowEdge", distance_km: float) -> None:
+        """Set an edge's distance and its display label."""
+        self.edge_distances[edge.id] = distance_km
+        edge.label = f"{distance_km:.1f} km"
+
+    def prune_edge_distances(self) -> None:
+        """Forget distances of edges no longer on the canvas."""
+        live = {e.id for e in self.flow_state.edges} if self.flow_state else set()
+        for edge_id in self.edge_distances.keys() - live:
+            del self.edge_distances[edge_id]
+
+    def replace_node_data(self, items: list[NodeData]) -> None:
+        """Replace all node data and rebuild the id index."""
+        self.node_data_list = list(items)
+        self._node_index = {nd.id: i for i, nd in enumerate(self.node_data_list)}
+
+
+def _parse_distance_label(label: Optional[str]) -> Optional[float]:
+    """Read the distance back out of an edge label such as ``"5.0 km"``."""
+    if not label:
+        return None
+    try:
+        return float(label.replace(" km", ""))
+    except ValueError:
+        return None
+
 
 def init_canvas_state() -> CanvasState:
     """Initialize canvas state with empty scenario."""
+    from streamlit_flow import StreamlitFlowState
+
     return CanvasState(
         flow_state=StreamlitFlowState(nodes=[], edges=[]),
     )
@@ -202,6 +311,8 @@ def init_canvas_state() -> CanvasState:
 
 def get_canvas_state() -> CanvasState:
     """Get or create canvas state from session state."""
+    import streamlit as st
+
     if "canvas_state" not in st.session_state:
         st.session_state.canvas_state = init_canvas_state()
     return st.session_state.canvas_state
@@ -213,16 +324,24 @@ def create_flow_node(
     node_type: NodeType,
     x: float,
     y: float,
-) -> StreamlitFlowNode:
-    """Create a StreamlitFlowNode with proper styling."""
-    config = NODE_CONFIG.get(node_type, NODE_CONFIG[NodeType.COMBAT])
-    label = NODE_ICONS.get(node_type, "Node")
+    content: Optional[str] = None,
+) -> "StreamlitFlowNode":
+    """Create a StreamlitFlowNode with proper styling.
+
+    ``content`` may be passed pre-formatted when building many nodes at once;
+    otherwise it is derived from the name and the node type's label.
+    """
+    from streamlit_flow.elements import StreamlitFlowNode
+
+    idx = _NODE_TYPE_INDEX[node_type]
+    if content is None:
+        content = f"**{name}**\n{_NODE_ICONS_ARR[idx]}"
 
     return StreamlitFlowNode(
         id=node_id,
         pos=(x * 50, y * 50),  # Scale for better visual spacing
         data={
-            "content": f"**{name}**\n{label}",
+            "content": content,
             "node_type": node_type.value,
             "name": name,
         },
@@ -231,19 +350,12 @@ def create_flow_node(
         target_position="left",
         draggable=True,
         connectable=True,
-        style={
-            "backgroundColor": config["color"],
-            "color": "white" if config["color"] not in ["#FFFF00", "#44FF44", "#FFAA00"] else "black",
-            "padding": "10px",
-            "borderRadius": "8px",
-            "border": "2px solid #333",
-            "minWidth": "100px",
-            "textAlign": "center",
-        },
+        # Copy: StreamlitFlowNode fills in width/height on the dict it is given
+        style=dict(_NODE_STYLE_ARR[idx]),
     )
 
 
-def get_node_position(flow_node: StreamlitFlowNode) -> tuple[float, float]:
+def get_node_position(flow_node: "StreamlitFlowNode") -> tuple[float, float]:
     """Return node position across streamlit-flow versions."""
     pos = None
     if hasattr(flow_node, "pos") and flow_node.pos is not None:
@@ -265,8 +377,10 @@ def create_flow_edge(
     from_node: str,
     to_node: str,
     distance_km: float,
-) -> StreamlitFlowEdge:
+) -> "StreamlitFlowEdge":
     """Create a StreamlitFlowEdge."""
+    from streamlit_flow.elements import StreamlitFlowEdge
+
     return StreamlitFlowEdge(
         id=edge_id,
         source=from_node,
@@ -278,28 +392,38 @@ def create_flow_edge(
     )
 
 
-def scenario_to_flow_state(scenario_dict: dict) -> tuple[StreamlitFlowState, dict[str, NodeData]]:
+def scenario_to_flow_state(scenario_dict: dict) -> tuple["StreamlitFlowState", list[NodeData]]:
     """Convert a scenario dictionary to flow state and node data."""
-    nodes = []
+    from streamlit_flow import StreamlitFlowState
+
     edges = []
-    node_data = {}
+    node_data = []
 
     # Convert nodes
-    for node in scenario_dict.get("nodes", []):
-        node_id = node["id"]
-        node_type = NodeType(node["type"])
-        name = node.get("name", node_id)
-        x = node["coordinates"]["x"]
-        y = node["coordinates"]["y"]
-
-        flow_node = create_flow_node(node_id, name, node_type, x, y)
-        nodes.append(flow_node)
+    raw_nodes = scenario_dict.get("nodes", [])
+    node_types = [NodeType(node["type"]) for node in raw_nodes]
+    names = [node.get("name", node["id"]) for node in raw_nodes]
+    labels = [_NODE_ICONS_ARR[_NODE_TYPE_INDEX[nt]] for nt in node_types]
+    contents = [f"**{name}**\n{label}" for name, label in zip(names, labels)]
+    nodes = [
+        create_flow_node(
+            node["id"],
+            name,
+            node_type,
+            node["coordinates"]["x"],
+            node["coordinates"]["y"],
+            content=content,
+        )
+        for node, name, node_type, content in zip(raw_nodes, names, node_types, contents)
+    ]
 
-        # Store extended data
+    # Store extended data
+    for node, name, node_type in zip(raw_nodes, names, node_types):
+        node_id = node["id"]
         capacity = node.get("capacity", {})
         properties = node.get("properties", {})
 
-        node_data[node_id] = NodeData(
+        node_data.append(NodeData(
             id=node_id,
             name=name,
             node_type=node_type,
@@ -314,7 +438,7 @@ def scenario_to_flow_state(scenario_dict: dict) -> tuple[StreamlitFlowState, dic
             repair_time_heavy=properties.get("repair_time_heavy_mins"),
             initial_stock=properties.get("initial_ammo_stock"),
             resupply_interval_hours=properties.get("resupply_interval_hours"),
-        )
+        ))
 
     # Convert edges
     for edge in scenario_dict.get("edges", []):
@@ -340,7 +464,7 @@ def flow_state_to_scenario_dict(canvas_state: CanvasState) -> dict:
     # Convert nodes
     for flow_node in canvas_state.flow_state.nodes:
         node_id = flow_node.id
-        data = canvas_state.node_data.get(node_id)
+        data = canvas_state.get_node_data(node_id)
 
         if data:
             node_type = data.node_type.value
@@ -398,17 +522,10 @@ def flow_state_to_scenario_dict(canvas_state: CanvasState) -> dict:
 
     # Convert edges
     for flow_edge in canvas_state.flow_state.edges:
-        # Extract distance from label
-        label = flow_edge.label or "1.0 km"
-        try:
-            distance = float(label.replace(" km", ""))
-        except ValueError:
-            distance = 1.0
-
         edge_dict = {
             "from": flow_edge.source,
             "to": flow_edge.target,
-            "distance_km": distance,
+            "distance_km": canvas_state.get_edge_distance(flow_edge, default=1.0),
             "bidirectional": True,
         }
         edges.append(edge_dict)
@@ -424,11 +541,15 @@ def flow_state_to_scenario_dict(canvas_state: CanvasState) -> dict:
         })
 
     # Convert vehicle types (include used types from library)
-    used_types = set(v.type_id for v in canvas_state.vehicles)
+    used_types = set()
     vehicle_types = []
-    for type_id in used_types:
-        if type_id in VEHICLE_TYPE_LIBRARY:
-            vehicle_types.append(VEHICLE_TYPE_LIBRARY[type_id])
+    for v in canvas_state.vehicles:
+        type_id = v.type_id
+        if type_id not in used_types and type_id in VEHICLE_TYPE_LIBRARY:
+            used_types.add(type_id)
+            vehicle_types.append(
+                VEHICLE_TYPE_LIBRARY[type_id].model_dump(mode="json", exclude_none=True)
+            )
 
     # Convert demand
     demand = {"mode": canvas_state.demand_mode.value}
@@ -478,20 +599,25 @@ def flow_state_to_scenario_dict(canvas_state: CanvasState) -> dict:
     }
 
 
+# Callsign prefixes by vehicle role
+CALLSIGN_PREFIXES = {
+    VehicleRole.AMBULANCE: "MEDIC",
+    VehicleRole.RECOVERY: "WRECKER",
+    VehicleRole.AMMO_LOGISTICS: "CARGO",
+    VehicleRole.FUEL_LOGISTICS: "PETROL",
+    VehicleRole.GENERAL_LOGISTICS: "LOGGY",
+}
+
+_CALLSIGN_PATTERNS = {
+    prefix: re.compile(rf"^{prefix}\s*(\d+)$", re.IGNORECASE)
+    for prefix in (*CALLSIGN_PREFIXES.values(), "VEH")
+}
+
+
 def generate_callsign(role: VehicleRole, existing: list[str]) -> str:
     """Generate next available callsign for a vehicle role."""
-    import re
-
-    prefixes = {
-        VehicleRole.AMBULANCE: "MEDIC",
-        VehicleRole.RECOVERY: "WRECKER",
-        VehicleRole.AMMO_LOGISTICS: "CARGO",
-        VehicleRole.FUEL_LOGISTICS: "PETROL",
-        VehicleRole.GENERAL_LOGISTICS: "LOGGY",
-    }
-    prefix = prefixes.get(role, "VEH")
-
-    pattern = re.compile(rf"^{prefix}\s*(\d+)$", re.IGNORECASE)
+    prefix = CALLSIGN_PREFIXES.get(role, "VEH")
+    pattern = _CALLSIGN_PATTERNS[prefix]
     used_numbers = set()
     for cs in existing:
         match = pattern.match(cs)
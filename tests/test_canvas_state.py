@@ -0,0 +1,64 @@
+"""Tests for the scenario builder canvas state."""
+
+import pytest
+
+pytest.importorskip("streamlit_flow")
+
+from streamlit_flow import StreamlitFlowState
+
+from pj_ogun.models.enums import NodeType
+from pj_ogun.ui.state.canvas_state import CanvasState, create_flow_edge
+
+
+class TestEdgeDistances:
+    @pytest.fixture
+    def canvas_state(self):
+        state = CanvasState()
+        state.flow_state = StreamlitFlowState(nodes=[], edges=[])
+        return state
+
+    def test_label_parsed_and_cached(self, canvas_state):
+        edge = create_flow_edge("e1", "a", "b", 12.5)
+        assert canvas_state.get_edge_distance(edge) == 12.5
+        assert canvas_state.edge_distances == {"e1": 12.5}
+
+    def test_fallback_default_not_cached(self, canvas_state):
+        edge = create_flow_edge("e1", "a", "b", 1.0)
+        edge.label = "far"
+        assert canvas_state.get_edge_distance(edge, default=5.0) == 5.0
+        assert canvas_state.get_edge_distance(edge, default=1.0) == 1.0
+        assert "e1" not in canvas_state.edge_distances
+
+    def test_prune_drops_removed_edges(self, canvas_state):
+        kept = create_flow_edge("e1", "a", "b", 2.0)
+        removed = create_flow_edge("e2", "b", "c", 3.0)
+        canvas_state.flow_state.edges = [kept, removed]
+        canvas_state.set_edge_distance(kept, 2.0)
+        canvas_state.set_edge_distance(removed, 3.0)
+
+        canvas_state.flow_state.edges = [kept]
+        canvas_state.prune_edge_distances()
+        assert canvas_state.edge_distances == {"e1": 2.0}
+
+        # A reused id reads its own label, not the stale distance
+        reused = create_flow_edge("e2", "a", "c", 7.0)
+        assert canvas_state.get_edge_distance(reused) == 7.0
+
+
+class TestNodeNumbering:
+    def test_numbering_is_per_type(self):
+        canvas_state = CanvasState()
+        assert canvas_state.next_node_number(NodeType.COMBAT) == 1
+        assert canvas_state.next_node_number(NodeType.COMBAT) == 2
+        assert canvas_state.next_node_number(NodeType.AMMO_POINT) == 1
+
+    def test_numbering_restarts_after_clear(self):
+        canvas_state = CanvasState()
+        canvas_state.next_node_number(NodeType.COMBAT)
+        canvas_state.next_node_number(NodeType.COMBAT)
+
+        # What "Clear All" and scenario loading do
+        canvas_state.replace_node_data([])
+        canvas_state.edge_distances.clear()
+        canvas_state.node_type_counters.clear()
+        assert canvas_state.next_node_number(NodeType.COMBAT) == 1
@@ -0,0 +1,80 @@
+"""Tests for the ogun command line interface."""
+
+import sys
+
+import orjson
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from pj_ogun.cli import main
+from pj_ogun.models.scenario import load_scenario
+
+
+SCENARIO = Path(__file__).parent.parent / "scenarios" / "example_medevac.json"
+
+
+def run_cli(monkeypatch, *argv: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["ogun", *argv])
+    return main()
+
+
+class TestRunReplications:
+    @pytest.fixture
+    def base_seed(self):
+        if not SCENARIO.exists():
+            pytest.skip("Example scenario not found")
+        return load_scenario(str(SCENARIO)).config.random_seed
+
+    def test_replications(self, monkeypatch, tmp_path, base_seed):
+        single_dir = tmp_path / "single"
+        runs_dir = tmp_path / "runs"
+        assert run_cli(monkeypatch, "run", str(SCENARIO), "-o", str(single_dir)) == 0
+        assert run_cli(
+            monkeypatch, "run", str(SCENARIO),
+            "--runs", "2", "--workers", "1", "-o", str(runs_dir),
+        ) == 0
+
+        runs_df = pd.read_csv(runs_dir / "runs.csv")
+        assert runs_df["run"].tolist() == [0, 1]
+        assert runs_df["seed"].tolist() == [base_seed, base_seed + 1]
+
+        runs = orjson.loads((runs_dir / "kpis_runs.json").read_bytes())
+        assert [run.pop("seed") for run in runs] == [base_seed, base_seed + 1]
+
+        # Run 0 is the same simulation as a single ogun run
+        single = orjson.loads((single_dir / "kpis.json").read_bytes())
+        assert runs[0] == single
+
+    @pytest.mark.parametrize("argv", [
+        ("--runs", "0"),
+        ("--runs", "-2"),
+        ("--workers", "0"),
+    ])
+    def test_rejects_non_positive_counts(self, monkeypatch, capsys, argv):
+        with pytest.raises(SystemExit) as exc:
+            run_cli(monkeypatch, "run", str(SCENARIO), *argv)
+        assert exc.value.code == 2
+        assert "positive integer" in capsys.readouterr().err
+
+
+class TestValidate:
+    def test_valid_scenario(self, monkeypatch, capsys):
+        if not SCENARIO.exists():
+            pytest.skip("Example scenario not found")
+        assert run_cli(monkeypatch, "validate", str(SCENARIO)) == 0
+        assert "Valid scenario" in capsys.readouterr().out
+
+    def test_truncated_json(self, monkeypatch, capsys, tmp_path):
+        path = tmp_path / "truncated.json"
+        path.write_bytes(b'{"name": "Truncated", "nodes": [')
+        assert run_cli(monkeypatch, "validate", str(path)) == 1
+        err = capsys.readouterr().err
+        assert err.startswith("ERROR: Invalid JSON: ")
+        assert "Schema validation failed" not in err
+
+    def test_schema_error(self, monkeypatch, capsys, tmp_path):
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"{}")
+        assert run_cli(monkeypatch, "validate", str(path)) == 1
+        assert "ERROR: Schema validation failed:" in capsys.readouterr().err
@@ -1,6 +1,6 @@
 """Tests for Pj-OGUN schema models."""
 
-import json
+import orjson
 import pytest
 from pathlib import Path
 
@@ -15,6 +15,7 @@ from pj_ogun.models import (
     Node,
     NodeCapacity,
     NodeType,
+    RateBasedDemand,
     Scenario,
     SimulationConfig,
     SpeedProfile,
@@ -67,6 +68,17 @@ class TestNode:
             capacity=NodeCapacity(treatment_slots=2, holding_casualties=6),
         )
         assert node.capacity.treatment_slots == 2
+    
+    def test_node_is_immutable_and_hashable(self):
+        node = Node(
+            id="test_node",
+            name="Test",
+            type=NodeType.COMBAT,
+            coordinates=Coordinates(x=0, y=0),
+        )
+        with pytest.raises(ValidationError):
+            node.name = "Renamed"
+        assert {node: 1}[node] == 1
 
 
 class TestEdge:
@@ -136,6 +148,25 @@ class TestVehicleType:
             service_times=ServiceTimes(load_time_mins=5, unload_time_mins=5),
         )
         assert vt.casualty_capacity == 2
+    
+    def test_template_library_is_validated(self):
+        from pj_ogun.models.vehicles import (
+            VEHICLE_TYPE_LIBRARY,
+            get_vehicle_type_template,
+        )
+        vt = get_vehicle_type_template("amb_light")
+        assert vt.role == VehicleRole.AMBULANCE
+        assert VEHICLE_TYPE_LIBRARY["amb_light"] is vt
+        with pytest.raises(KeyError):
+            get_vehicle_type_template("no_such_type")
+    
+    def test_vehicle_type_is_immutable_and_hashable(self):
+        from pj_ogun.models.vehicles import get_vehicle_type_template
+        vt = get_vehicle_type_template("amb_light")
+        with pytest.raises(ValidationError):
+            vt.casualty_capacity = 8
+        variant = vt.model_copy(update={"id": "amb_light_x"})
+        assert len({vt, variant}) == 2
 
 
 class TestDemandConfiguration:
@@ -159,6 +190,48 @@ class TestDemandConfiguration:
             ],
         )
         assert len(config.manual_events) == 1
+    
+    def test_manual_events_sorted_on_validation(self):
+        config = DemandConfiguration(
+            mode=DemandMode.MANUAL,
+            manual_events=[
+                ManualDemandEvent(time_mins=t, type=DemandType.CASUALTY, location=loc)
+                for t, loc in [(90, "c"), (30, "a"), (60, "b"), (30, "d")]
+            ],
+        )
+        events = config.get_manual_events_sorted()
+        assert [e.location for e in events] == ["a", "d", "b", "c"]
+
+
+class TestRateBasedDemand:
+    def test_arrivals_within_active_window(self):
+        import numpy as np
+        
+        demand = RateBasedDemand(
+            type=DemandType.CASUALTY,
+            location="combat_a",
+            rate_per_hour=6.0,
+            active_from_mins=60,
+            active_until_mins=240,
+        )
+        times = demand.sample_arrival_times(np.random.default_rng(42), 480)
+        
+        assert len(times) > 0
+        assert np.all(np.diff(times) >= 0)
+        assert times[0] >= 60
+        assert times[-1] < 240
+    
+    def test_arrivals_deterministic_for_seed(self):
+        import numpy as np
+        
+        demand = RateBasedDemand(
+            type=DemandType.CASUALTY,
+            location="combat_a",
+            rate_per_hour=2.0,
+        )
+        t1 = demand.sample_arrival_times(np.random.default_rng(7), 480)
+        t2 = demand.sample_arrival_times(np.random.default_rng(7), 480)
+        assert np.array_equal(t1, t2)
 
 
 class TestScenario:
@@ -169,8 +242,7 @@ class TestScenario:
         if not scenario_path.exists():
             pytest.skip("Example scenario not found")
         
-        with open(scenario_path) as f:
-            data = json.load(f)
+        data = orjson.loads(scenario_path.read_bytes())
         
         scenario = Scenario.model_validate(data)
         
@@ -236,6 +308,12 @@ class TestScenario:
         
         assert "Basic MEDEVAC Exercise" in summary
         assert "8 hours" in summary or "8.0 hours" in summary
+    
+    def test_cached_schema(self):
+        """Test schema is built once and matches pydantic's output."""
+        schema = Scenario.cached_schema()
+        assert schema is Scenario.cached_schema()
+        assert schema == Scenario.model_json_schema()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+"""Tests for the replay component's precomputed frame data."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("plotly")
+
+from pj_ogun.models.enums import EventType, Priority, VehicleState
+from pj_ogun.simulation.events import EventLog
+from pj_ogun.ui.components.replay import (
+    _EVENT_TO_STATE,
+    _STATE_CODES,
+    PlaybackState,
+    build_casualty_intervals,
+    build_network_graph,
+    build_node_positions,
+    build_transit_segments,
+    build_vehicle_event_index,
+)
+
+
+NODE_INDEX = {"bn_hq": 0, "coy_a": 1}
+NODE_XY = np.array([[2.0, 4.0], [12.0, 24.0]])
+
+
+@pytest.fixture
+def event_log():
+    log = EventLog()
+    log.log_event(10.0, EventType.VEHICLE_DISPATCHED, "AMB_1", "bn_hq", destination="coy_a")
+    log.log_event(5.0, EventType.CASUALTY_GENERATED, "CAS_0001", "coy_a")
+    log.log_event(20.0, EventType.VEHICLE_ARRIVED, "AMB_1", "coy_a", leg=1)
+    log.log_event(12.0, EventType.VEHICLE_ARRIVED, "AMB_2", "off_map")
+    log.log_event(30.0, EventType.VEHICLE_DISPATCHED, "AMB_3", "bn_hq", destination="off_map")
+    log.log_event(40.0, EventType.VEHICLE_ARRIVED, "AMB_3", "off_map")
+    return log
+
+
+@pytest.fixture
+def segments(event_log):
+    vehicle_index = build_vehicle_event_index(event_log)
+    return build_transit_segments(["AMB_1", "AMB_2", "AMB_3", "AMB_4"], vehicle_index, NODE_INDEX)
+
+
+class TestTransitPositions:
+    def test_origin_before_first_event(self, segments):
+        positions = segments.positions_at(0.0, NODE_XY)
+        np.testing.assert_array_equal(positions, np.zeros((4, 2)))
+
+    @pytest.mark.parametrize("time, expected", [
+        (10.0, [2.0, 4.0]),
+        (15.0, [7.0, 14.0]),
+        (17.5, [9.5, 19.0]),
+    ])
+    def test_interpolated_in_transit(self, segments, time, expected):
+        np.testing.assert_allclose(segments.positions_at(time, NODE_XY)[0], expected)
+
+    @pytest.mark.parametrize("time", [20.0, 60.0])
+    def test_parked_after_arrival(self, segments, time):
+        np.testing.assert_array_equal(segments.positions_at(time, NODE_XY)[0], [12.0, 24.0])
+
+    def test_unknown_location_falls_back_to_origin(self, segments):
+        # AMB_2 arrives off the map, AMB_3 is heading off the map and
+        # AMB_4 has no events
+        positions = segments.positions_at(35.0, NODE_XY)
+        np.testing.assert_array_equal(positions[1:], np.zeros((3, 2)))
+
+
+class TestTransitStates:
+    def test_state_after_each_event_type(self):
+        log = EventLog()
+        # Each state-changing event follows one that sets a different
+        # state, and is followed by one that leaves the state alone
+        for i, (event_type, state) in enumerate(_EVENT_TO_STATE.items()):
+            primer = (
+                EventType.HOOKUP_STARTED
+                if state != VehicleState.HOOKUP
+                else EventType.LOADING_STARTED
+            )
+            log.log_event(10.0 * i, primer, "AMB_1", "bn_hq")
+            log.log_event(10.0 * i + 1, event_type, "AMB_1", "bn_hq")
+            log.log_event(10.0 * i + 5, EventType.CASUALTY_COLLECTED, "AMB_1", "bn_hq")
+        segments = build_transit_segments(
+            ["AMB_1"], build_vehicle_event_index(log), NODE_INDEX
+        )
+
+        assert segments.states_at(-1.0) == [VehicleState.IDLE]
+        for i, state in enumerate(_EVENT_TO_STATE.values()):
+            for time in (10.0 * i + 1, 10.0 * i + 5):
+                assert segments.state_codes_at(time)[0] == _STATE_CODES[state]
+                assert segments.states_at(time) == [state]
+
+    def test_states_of_all_vehicles(self, segments):
+        assert segments.states_at(15.0) == [
+            VehicleState.TRANSITING_UNLADEN,
+            VehicleState.IDLE,
+            VehicleState.IDLE,
+            VehicleState.IDLE,
+        ]
+
+
+class TestCasualtyIntervals:
+    @pytest.fixture
+    def intervals(self, event_log):
+        collected = event_log.create_casualty(Priority.URGENT, "coy_a", 5.0)
+        collected.time_collected = 25.0
+        event_log.create_casualty(Priority.ROUTINE, "bn_hq", 8.0)
+        event_log.create_casualty(Priority.URGENT, "off_map", 1.0)
+        return build_casualty_intervals(event_log, NODE_INDEX)
+
+    def test_never_collected_is_infinite(self, intervals):
+        assert intervals.ids == ["CAS_0001", "CAS_0002", "CAS_0003"]
+        np.testing.assert_array_equal(intervals.collected, [25.0, np.inf, np.inf])
+        np.testing.assert_array_equal(intervals.row, [1, 0, -1])
+
+    @pytest.mark.parametrize("time, expected", [
+        (4.9, []),
+        (5.0, [0]),
+        (8.0, [0, 1]),
+        (24.9, [0, 1]),
+        (25.0, [1]),
+        (1e9, [1]),
+    ])
+    def test_active_from_generated_until_collected(self, intervals, time, expected):
+        # Off-map casualties are never drawn
+        assert intervals.active_at(time).tolist() == expected
+
+
+class TestSinglePrecision:
+    def test_node_positions_are_float32(self):
+        pytest.importorskip("networkx")
+        scenario_data = {
+            "nodes": [
+                {"id": "bn_hq", "type": "hq", "coordinates": {"x": 2.0, "y": 4.0}},
+                {"id": "coy_a", "type": "combat", "coordinates": {"x": 12.0, "y": 24.0}},
+            ],
+        }
+        node_index, node_xy = build_node_positions(build_network_graph(scenario_data))
+        assert node_index == NODE_INDEX
+        assert node_xy.dtype == np.float32
+        np.testing.assert_array_equal(node_xy, NODE_XY)
+
+    @pytest.mark.parametrize("time", [0.0, 10.0, 13.3, 17.77, 20.0, 35.0])
+    def test_float32_positions_match_float64(self, segments, time):
+        expected = segments.positions_at(time, NODE_XY)
+        positions = segments.positions_at(time, NODE_XY.astype(np.float32))
+        assert positions.dtype == np.float32
+        np.testing.assert_allclose(positions, expected, rtol=1e-6, atol=1e-5)
+
+
+class TestEventJumps:
+    EVENT_TIMES = np.array([10.0, 20.0, 30.0])
+
+    def jump(self, current_time, forward):
+        playback = PlaybackState(current_time_mins=current_time, event_times=self.EVENT_TIMES)
+        if forward:
+            playback.jump_to_next_event()
+        else:
+            playback.jump_to_prev_event()
+        return playback.current_time_mins
+
+    def test_next_skips_event_within_tenth_of_a_minute(self):
+        assert self.jump(20.0 - 0.1, forward=True) == 30.0
+        assert self.jump(19.8, forward=True) == 20.0
+
+    def test_next_from_event_time(self):
+        assert self.jump(20.0, forward=True) == 30.0
+        assert self.jump(30.0, forward=True) == 30.0
+
+    def test_prev_skips_event_within_tenth_of_a_minute(self):
+        assert self.jump(20.0 + 0.1, forward=False) == 10.0
+        assert self.jump(20.2, forward=False) == 20.0
+
+    def test_prev_from_event_time(self):
+        assert self.jump(20.0, forward=False) == 10.0
+        assert self.jump(10.0, forward=False) == 10.0
+
+    def test_matches_strict_tenth_of_a_minute_margin(self):
+        # Next is the first event strictly after current + 0.1, previous
+        # the last event strictly before current - 0.1
+        for current_time in np.arange(0.0, 35.0, 0.05):
+            later = [t for t in self.EVENT_TIMES if t > current_time + 0.1]
+            earlier = [t for t in self.EVENT_TIMES if t < current_time - 0.1]
+            next_time = later[0] if later else current_time
+            prev_time = earlier[-1] if earlier else current_time
+            assert self.jump(current_time, forward=True) == next_time
+            assert self.jump(current_time, forward=False) == prev_time
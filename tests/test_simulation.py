@@ -46,6 +46,40 @@ class TestSimulationEngine:
         casualties = event_log.casualties
         assert len(casualties) == 10  # 1+1+2+1+1+2+1+1 = 10
     
+    @pytest.mark.parametrize("seed, expected, first_arrival", [
+        (42, {"combat_alpha": 7, "combat_bravo": 7}, 70.778),
+        (43, {"combat_alpha": 13, "combat_bravo": 5}, 6.618),
+    ])
+    def test_rate_based_arrivals_pinned(self, example_scenario, seed, expected, first_arrival):
+        """Seeded rate-based arrival counts stay fixed.
+
+        Arrival times are drawn in batches from a numpy Generator seeded
+        with random_seed; a change here changes every seeded result.
+        """
+        from collections import Counter
+        from pj_ogun.models.scenario import Scenario
+
+        data = example_scenario.model_dump(mode="json", by_alias=True)
+        data["config"]["random_seed"] = seed
+        data["demand"] = {
+            "mode": "rate_based",
+            "rate_based": [
+                {"type": "casualty", "location": "combat_alpha", "rate_per_hour": 1.5},
+                {
+                    "type": "casualty",
+                    "location": "combat_bravo",
+                    "rate_per_hour": 1.0,
+                    "active_from_mins": 60,
+                    "active_until_mins": 300,
+                },
+            ],
+        }
+        event_log = SimulationEngine(Scenario.model_validate(data)).run()
+
+        casualties = event_log.casualties
+        assert Counter(c.origin_node for c in casualties) == expected
+        assert casualties[0].time_generated == pytest.approx(first_arrival, abs=1e-3)
+    
     def test_casualties_evacuated(self, example_scenario):
         """Test that casualties are collected and delivered."""
         engine = SimulationEngine(example_scenario)
@@ -161,5 +195,96 @@ class TestNetworkRouting:
         assert nearest == "role1_aid"
 
 
+class TestEventLog:
+    @pytest.fixture
+    def event_log(self):
+        from pj_ogun.simulation.events import EventLog
+        log = EventLog()
+        log.log_event(10.0, EventType.VEHICLE_DISPATCHED, "AMB_1", "bn_hq")
+        log.log_event(5.0, EventType.CASUALTY_GENERATED, "CAS_0001", "coy_a")
+        log.log_event(20.0, EventType.VEHICLE_ARRIVED, "AMB_1", "coy_a", leg=1)
+        return log
+    
+    def test_filter_by_time(self, event_log):
+        # Logged out of order, returned in time order without reading .events
+        events = event_log.filter_by_time(5.0, 10.0)
+        assert [e.entity_id for e in events] == ["CAS_0001", "AMB_1"]
+        assert len(event_log.filter_by_time(15.0)) == 1
+    
+    def test_dataframe_is_chronological(self, event_log):
+        df = event_log.to_dataframe()
+        assert list(df["time_mins"]) == [5.0, 10.0, 20.0]
+        assert list(df["event_type"]) == [
+            EventType.CASUALTY_GENERATED.value,
+            EventType.VEHICLE_DISPATCHED.value,
+            EventType.VEHICLE_ARRIVED.value,
+        ]
+        assert df["leg"].isna().sum() == 2
+    
+    def test_filter_by_entity_and_location(self, event_log):
+        assert [e.time_mins for e in event_log.filter_by_entity("AMB_1")] == [10.0, 20.0]
+        assert [e.entity_id for e in event_log.filter_by_location("coy_a")] == [
+            "CAS_0001",
+            "AMB_1",
+        ]
+        assert event_log.filter_by_entity("missing") == []
+    
+    def test_indexed_filters_are_chronological(self, event_log):
+        # Same order whether or not .events has been read yet
+        late = event_log.log_event(1.0, EventType.VEHICLE_DISPATCHED, "AMB_1", "coy_a")
+        before = (
+            event_log.filter_by_entity("AMB_1"),
+            event_log.filter_by_location("coy_a"),
+            event_log.filter_by_type(EventType.VEHICLE_DISPATCHED),
+        )
+        assert [e.time_mins for e in before[0]] == [1.0, 10.0, 20.0]
+        assert [e.time_mins for e in before[1]] == [1.0, 5.0, 20.0]
+        assert before[2][0] is late
+        event_log.events
+        after = (
+            event_log.filter_by_entity("AMB_1"),
+            event_log.filter_by_location("coy_a"),
+            event_log.filter_by_type(EventType.VEHICLE_DISPATCHED),
+        )
+        assert after == before
+    
+    def test_events_are_read_only(self, event_log):
+        events = event_log.events
+        assert isinstance(events, tuple)
+        event_log.log_event(30.0, EventType.VEHICLE_RETURNED, "AMB_1", "bn_hq")
+        assert len(events) == 3
+        assert len(event_log.events) == 4
+    
+    def test_parquet_round_trip(self, event_log, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+        path = tmp_path / "events.parquet"
+        event_log.to_parquet(path)
+        df = pd.read_parquet(path)
+        assert list(df["time_mins"]) == [5.0, 10.0, 20.0]
+        assert list(df["entity_id"]) == ["CAS_0001", "AMB_1", "AMB_1"]
+    
+    def test_arrow_columns(self, event_log):
+        pa = pytest.importorskip("pyarrow")
+        table = event_log.to_arrow()
+        assert table.schema.field("time_mins").type == pa.float64()
+        assert pa.types.is_dictionary(table.schema.field("event_type").type)
+        assert table.column("event_type").to_pylist() == [
+            EventType.CASUALTY_GENERATED.value,
+            EventType.VEHICLE_DISPATCHED.value,
+            EventType.VEHICLE_ARRIVED.value,
+        ]
+        assert table.column("leg").to_pylist() == [None, None, 1]
+        assert table.to_pandas().equals(event_log.to_dataframe())
+    
+    def test_events_sorted_once(self, event_log):
+        events = event_log.events
+        assert [e.time_mins for e in events] == [5.0, 10.0, 20.0]
+        assert event_log.events is events
+        assert [e.time_mins for e in event_log.filter_by_time(6.0)] == [10.0, 20.0]
+        assert [e.time_mins for e in event_log.filter_by_time(10.0, 20.0)] == [10.0, 20.0]
+        assert event_log.filter_by_time(21.0) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])